@@ -8,12 +8,9 @@ sys.path.append(".")
 # --- Local Imports ---
 import dashboard.config as config
 from dashboard.data_loader import load_bitcoin_data
-from dashboard.model.strategy_new import compute_weights
-from dashboard.model.strategy_gt import (
-    compute_weights as compute_weights_gt,
-)  # Example for alternate model
 from dashboard.sidebar import render_sidebar
 from dashboard.simulation import (
+    compute_strategy_weights,
     simulate_accumulation,
     calculate_uniform_dca_performance,
     update_bayesian_belief,
@@ -31,7 +28,7 @@ def initialize_session_state():
         "prior_mean": 0.0,
         "prior_var": 1.0,
         "bayesian_history": [],
-        "last_start_date": None,
+        "last_start_date_ns": None,
         "last_investment_window": None,
     }
     for key, value in defaults.items():
@@ -115,10 +112,9 @@ def main():
 
     # --- 4. Core Computations ---
     with st.spinner(f"🧮 Computing weights using {params['model_choice']}..."):
-        if params["model_choice"] == "GT-MSA-S25-Trilemma Model":
-            weights = compute_weights_gt(df_window)
-        else:
-            weights = compute_weights(df_window, boost_alpha=params["boost_alpha"])
+        weights = compute_strategy_weights(
+            df_window, params["model_choice"], params["boost_alpha"]
+        )
 
     # Run simulations based on computed weights up to the selected day
     dynamic_perf = simulate_accumulation(
@@ -145,7 +141,8 @@ def main():
     # Prepare a single, consistent DataFrame for charting that includes historical context
     chart_start_date = df_window.index.min() - pd.DateOffset(years=1)
     chart_end_date = df_window.index.max()
-    df_chart_display = df_btc.loc[chart_start_date:chart_end_date].copy()
+    # Read-only slice, so no copy
+    df_chart_display = df_btc.loc[chart_start_date:chart_end_date]
 
     # Render all performance tabs (Portfolio, Charts, etc.)
     render_performance(
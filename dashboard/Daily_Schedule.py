@@ -8,19 +8,15 @@ sys.path.append(".")
 # --- Local Imports ---
 import dashboard.config as config
 from dashboard.data_loader import load_bitcoin_data
-from dashboard.model.strategy_new import compute_weights
-from dashboard.model.strategy_gt import (
-    compute_weights as compute_weights_gt,
-)  # Example for alternate model
-from dashboard.sidebar_simplified import render_sidebar
+from dashboard.sidebar import render_sidebar
 from dashboard.simulation import (
+    compute_strategy_weights,
     simulate_accumulation,
     calculate_uniform_dca_performance,
     update_bayesian_belief,
 )
 from dashboard.ui.header import render_header
 from dashboard.ui.controls import render_controls
-from dashboard.ui.performance_tabs import render_performance
 from dashboard.ui.recommendations import render_recommendations
 from dashboard.ui.performance_tabs import render_purchasing_calendar
 
@@ -32,7 +28,7 @@ def initialize_session_state():
         "prior_mean": 0.0,
         "prior_var": 1.0,
         "bayesian_history": [],
-        "last_start_date": None,
+        "last_start_date_ns": None,
         "last_investment_window": None,
     }
     for key, value in defaults.items():
@@ -97,7 +93,7 @@ def main():
 
     # --- 1. Initialization and Sidebar ---
     initialize_session_state()
-    params = render_sidebar()
+    params = render_sidebar(model_selection=False)
 
     # --- 2. Data Loading ---
     with st.spinner("📥 Loading Bitcoin price data..."):
@@ -115,7 +111,7 @@ def main():
     )
 
     # --- FIXED: Extend df_window with future dates if end date is in the future ---
-    end_date = start_date + pd.DateOffset(days=params["investment_window"] - 1)
+    end_date = start_date + pd.Timedelta(days=params["investment_window"] - 1)
     last_date_in_window = df_window.index.max()
 
     # Only create future data if we need dates beyond what we already have
@@ -149,10 +145,9 @@ def main():
 
     # --- 4. Core Computations ---
     with st.spinner(f"🧮 Computing weights using {params['model_choice']}..."):
-        if params["model_choice"] == "GT-MSA-S25-Trilemma Model":
-            weights = compute_weights_gt(df_window)
-        else:
-            weights = compute_weights(df_window, boost_alpha=params["boost_alpha"])
+        weights = compute_strategy_weights(
+            df_window, params["model_choice"], params["boost_alpha"]
+        )
 
     # Run simulations based on computed weights up to the selected day
     dynamic_perf = simulate_accumulation(
@@ -176,11 +171,6 @@ def main():
         current_day=current_day,
     )
 
-    # Prepare a single, consistent DataFrame for charting that includes historical context
-    chart_start_date = df_window.index.min() - pd.DateOffset(years=1)
-    chart_end_date = df_window.index.max()
-    df_chart_display = df_btc.loc[chart_start_date:chart_end_date].copy()
-
     # Render all performance tabs (Portfolio, Charts, etc.)
     render_purchasing_calendar(
         df_window, dynamic_perf, weights, current_day, total_budget=params["budget"]
@@ -221,6 +221,11 @@ user_name = st.user.get("name", "there")
 logged_in = potential_email is not None
 
 
+def _set_state(key, value):
+    """Button callback: set a session-state flag before the rerun starts."""
+    st.session_state[key] = value
+
+
 # Main application logic
 def render_already_subscribed():
     """Render the UI for users already subscribed"""
@@ -250,9 +255,12 @@ def render_already_subscribed():
             st.session_state.show_unsub_confirm = False
 
         if not st.session_state.show_unsub_confirm:
-            if st.button("❌ Unsubscribe", use_container_width=True):
-                st.session_state.show_unsub_confirm = True
-                st.rerun()
+            st.button(
+                "❌ Unsubscribe",
+                on_click=_set_state,
+                args=("show_unsub_confirm", True),
+                use_container_width=True,
+            )
         else:
             st.warning("Are you sure?")
             col_yes, col_no = st.columns([2, 1])
@@ -265,9 +273,12 @@ def render_already_subscribed():
                     time.sleep(1)
                     st.rerun()
             with col_no:
-                if st.button("❌", use_container_width=True):
-                    st.session_state.show_unsub_confirm = False
-                    st.rerun()
+                st.button(
+                    "❌",
+                    on_click=_set_state,
+                    args=("show_unsub_confirm", False),
+                    use_container_width=True,
+                )
 
 
 def render_subscription_form():
@@ -315,9 +326,12 @@ def render_subscription_form():
     else:
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("🚀 Subscribe to Daily Updates", use_container_width=True):
-                st.session_state.processing = True
-                st.rerun()
+            st.button(
+                "🚀 Subscribe to Daily Updates",
+                on_click=_set_state,
+                args=("processing", True),
+                use_container_width=True,
+            )
 
 
 def process_subscription():
@@ -22,6 +22,10 @@ class PortfolioAnalyzer:
         """
         self.data = performance_df
         self.returns = self._calculate_returns()
+        # Finite returns, shared by the ratio and volatility methods
+        self._valid_returns = self.returns.replace([np.inf, -np.inf], np.nan).dropna()
+        # max_drawdown result, reused by calmar_ratio and get_all_metrics
+        self._drawdown = None
 
     def _calculate_returns(self) -> pd.Series:
         """Calculate the daily return rate"""
@@ -45,7 +49,7 @@ class PortfolioAnalyzer:
         if len(self.returns) < 2:
             return 0.0
 
-        valid_returns = self.returns.replace([np.inf, -np.inf], np.nan).dropna()
+        valid_returns = self._valid_returns
 
         if len(valid_returns) == 0:
             return 0.0
@@ -69,7 +73,7 @@ class PortfolioAnalyzer:
         if len(self.returns) < 2:
             return 0.0
 
-        valid_returns = self.returns.replace([np.inf, -np.inf], np.nan).dropna()
+        valid_returns = self._valid_returns
 
         if len(valid_returns) == 0:
             return 0.0
@@ -99,6 +103,12 @@ class PortfolioAnalyzer:
         Returns:
             (Maximum Drawdown Percentage, Start Date, End Date)
         """
+        if self._drawdown is None:
+            self._drawdown = self._calculate_max_drawdown()
+        return self._drawdown
+
+    def _calculate_max_drawdown(self) -> Tuple[float, pd.Timestamp, pd.Timestamp]:
+        """Compute the max_drawdown tuple from the portfolio value series"""
         portfolio_value = self.data['Portfolio_Value']
 
         if len(portfolio_value) == 0:
@@ -138,7 +148,7 @@ class PortfolioAnalyzer:
         if len(self.returns) < 2:
             return 0.0
 
-        valid_returns = self.returns.replace([np.inf, -np.inf], np.nan).dropna()
+        valid_returns = self._valid_returns
 
         if len(valid_returns) == 0:
             return 0.0
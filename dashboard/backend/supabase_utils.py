@@ -16,6 +16,17 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(show_spinner=False)
+def get_client(supabase_url: str, supabase_key: str) -> Client:
+    """
+    Return the process-wide Supabase client for these credentials.
+
+    Shared across all Streamlit sessions so page reruns that re-initialize
+    the database service reuse one connection pool instead of opening new ones.
+    """
+    return create_client(supabase_url, supabase_key)
+
+
 class DatabaseService:
     """Service class for managing user data in Supabase/PostgreSQL."""
 
@@ -31,7 +42,7 @@ class DatabaseService:
 
         if self.enabled:
             try:
-                self.client: Client = create_client(supabase_url, supabase_key)
+                self.client: Client = get_client(supabase_url, supabase_key)
                 logger.info("Supabase client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
@@ -544,13 +555,18 @@ def initialize_database(supabase_url: str, supabase_key: str) -> DatabaseService
     return _db_service_instance
 
 
-def get_database() -> Optional[DatabaseService]:
+def get_database() -> DatabaseService:
     """
     Get the database service instance.
 
+    Initializes it from the environment on first use if no caller has
+    called initialize_database yet.
+
     Returns:
-        DatabaseService instance or None if not initialized
+        DatabaseService instance
     """
+    if _db_service_instance is None:
+        return setup_database()
     return _db_service_instance
 
 
@@ -598,38 +614,41 @@ def setup_database() -> DatabaseService:
 # Convenience functions that mirror the original API
 def add_user_info_to_sheet(user_info: dict) -> Optional[Dict[str, Any]]:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.add_user_info(user_info) if db else None
+    return get_database().add_user_info(user_info)
 
 
 def get_user_info_by_email(user_email: str) -> Optional[Dict[str, Any]]:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.get_user_info_by_email(user_email) if db else None
+    return get_database().get_user_info_by_email(user_email)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_cached_user_info(user_email: str) -> Optional[Dict[str, Any]]:
+    """
+    get_user_info_by_email cached per email for 5 minutes, so widget reruns
+    don't each make a Supabase round trip. Call .clear() after writing prefs.
+    """
+    return get_user_info_by_email(user_email)
 
 
 def get_full_user_info(user_email: str) -> Optional[Dict[str, Any]]:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.get_full_user_info(user_email) if db else None
+    return get_database().get_full_user_info(user_email)
 
 
 def update_user_preferences(new_user_info: dict) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.update_user_preferences(new_user_info) if db else False
+    return get_database().update_user_preferences(new_user_info)
 
 
 def does_user_exist(user_email: str) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.does_user_exist(user_email) if db else False
+    return get_database().does_user_exist(user_email)
 
 
 def add_user_to_email_list(user_email: str) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.add_user_to_email_list(user_email) if db else False
+    return get_database().add_user_to_email_list(user_email)
 
 
 def add_coinbase_info(
@@ -638,36 +657,28 @@ def add_coinbase_info(
     """Legacy function name for backwards compatibility."""
     db = get_database()
     print(db)
-    return (
-        db.add_coinbase_info(
-            user_email=user_email,
-            client_api_key=api_client_key,
-            secret_api_key=api_secret_key,
-        )
-        if db
-        else False
+    return db.add_coinbase_info(
+        user_email=user_email,
+        client_api_key=api_client_key,
+        secret_api_key=api_secret_key,
     )
 
 
 def is_user_already_on_email(user_email: str) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.is_user_on_email_list(user_email) if db else False
+    return get_database().is_user_on_email_list(user_email)
 
 
 def is_user_coinbased(user_email: str) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.is_user_coinbased(user_email) if db else False
+    return get_database().is_user_coinbased(user_email)
 
 
 def remove_user_from_email_list(user_email: str) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.remove_user_from_email_list(user_email) if db else False
+    return get_database().remove_user_from_email_list(user_email)
 
 
 def remove_user_api_keys(user_email: str) -> bool:
     """Legacy function name for backwards compatibility."""
-    db = get_database()
-    return db.remove_user_api_keys(user_email) if db else False
+    return get_database().remove_user_api_keys(user_email)
@@ -1,4 +1,5 @@
 # dashboard/email_helpers/daily_emailer.py
+import numpy as np
 import pandas as pd
 import sys
 from datetime import datetime, timedelta
@@ -71,7 +72,7 @@ def get_users_opted_in_for_email() -> List[Dict[str, Any]]:
     """
     db = get_database()
 
-    if not db or not db.enabled:
+    if not db.enabled:
         logger.warning("Database not configured, cannot retrieve users")
         return []
 
@@ -119,7 +120,7 @@ def debug_calculate_user_buy_amount(
         Dictionary with calculation results or None on error
     """
     try:
-        start_date = pd.to_datetime(user_info["start_date"])
+        start_date = pd.Timestamp(user_info["start_date"])
         investment_window = user_info["investment_period"] * 30
         budget = user_info["budget"]
 
@@ -137,10 +138,13 @@ def debug_calculate_user_buy_amount(
         logger.info(f"Today: {datetime.now().date()}")
 
         # Match dashboard logic EXACTLY from render_controls
-        last_historical_date = df_btc[df_btc["Type"] == "Historical"].index.max()
+        # (mask the index directly rather than filtering the whole frame)
+        last_historical_date = df_btc.index[
+            df_btc["Type"].to_numpy() == "Historical"
+        ].max()
 
         # Determine the actual start for historical data
-        historical_start = max(start_date, df_btc.index.min())
+        historical_start = max(start_date, df_btc.index[0])  # index is sorted
         historical_end = min(end_date, last_historical_date)
 
         logger.info(f"\nStep 1: Extract historical window")
@@ -150,7 +154,11 @@ def debug_calculate_user_buy_amount(
 
         # Extract historical data that overlaps with our window
         if historical_start <= last_historical_date:
-            df_window = df_btc.loc[historical_start:historical_end].copy()
+            # Sorted index: slice by position from two binary searches (a
+            # view is enough, the window is only read below)
+            i0 = df_btc.index.searchsorted(historical_start, side="left")
+            i1 = df_btc.index.searchsorted(historical_end, side="right")
+            df_window = df_btc.iloc[i0:i1]
         else:
             # Entire window is in the future
             df_window = pd.DataFrame(columns=["PriceUSD", "Type"])
@@ -176,24 +184,31 @@ def debug_calculate_user_buy_amount(
                     f"\nStep 2: Extending {future_days} days into future from {future_start}"
                 )
 
-            # Create future date range
-            future_dates = pd.date_range(start=future_start, end=end_date, freq="D")
+            # Create future date range straight from int64 nanoseconds (one day apart)
+            n_future = (end_date - future_start).days + 1
+            future_dates = pd.DatetimeIndex(
+                future_start.value + np.arange(n_future, dtype=np.int64) * 86_400_000_000_000
+            )
 
             # Get last known price for future projections
-            last_price = df_btc["PriceUSD"].iloc[-1]
+            last_price = df_btc["PriceUSD"].to_numpy()[-1]
             logger.info(f"  Last known price: ${last_price:.2f}")
 
-            # Create placeholder future data
-            future_df = pd.DataFrame(
-                {
-                    "PriceUSD": [last_price] * len(future_dates),
-                    "Type": ["Future"] * len(future_dates),
-                },
-                index=future_dates,
+            # Fill historical and placeholder future rows into preallocated
+            # arrays and build the window once, instead of concatenating frames
+            n_hist = len(df_window)
+            total_len = n_hist + len(future_dates)
+            prices = np.empty(total_len, dtype=np.float64)
+            prices[:n_hist] = df_window["PriceUSD"].to_numpy(dtype=np.float64)
+            prices[n_hist:] = last_price
+            types = np.empty(total_len, dtype=object)
+            types[:n_hist] = df_window["Type"].to_numpy()
+            types[n_hist:] = "Future"
+
+            df_window = pd.DataFrame(
+                {"PriceUSD": prices, "Type": types},
+                index=df_window.index.append(future_dates) if n_hist else future_dates,
             )
-
-            # Append future data to df_window
-            df_window = pd.concat([df_window, future_df])
         else:
             logger.info(f"\nStep 2: No future dates needed")
 
@@ -224,26 +239,20 @@ def debug_calculate_user_buy_amount(
         logger.info(f"  Looking for date: {today_pd}")
         logger.info(f"  Date in df_window? {today_pd in df_window.index}")
 
-        # Match dashboard logic for finding "current_day"
-        if today_pd in df_window.index:
-            today_day_index = df_window.index.get_loc(today_pd)
+        # Match dashboard logic for finding "current_day": position of today,
+        # or of the closest earlier date, from one binary search
+        pos = int(df_window.index.searchsorted(today_pd, side="right")) - 1
+        if pos >= 0 and df_window.index[pos] == today_pd:
+            today_day_index = pos
             logger.info(f"  ✓ Found exact date at index {today_day_index}")
+        elif pos >= 0 and today_pd <= df_window.index[-1]:
+            today_day_index = pos
+            logger.info(
+                f"  ✓ Using closest date {df_window.index[pos]} at index {today_day_index}"
+            )
         else:
-            # Find closest date to today that's in our window
-            if today_pd <= df_window.index[-1]:
-                valid_dates = df_window.index[df_window.index <= today_pd]
-                if len(valid_dates) > 0:
-                    closest_date = valid_dates[-1]
-                    today_day_index = df_window.index.get_loc(closest_date)
-                    logger.info(
-                        f"  ✓ Using closest date {closest_date} at index {today_day_index}"
-                    )
-                else:
-                    today_day_index = len(df_window) - 1
-                    logger.info(f"  ✗ Using last date at index {today_day_index}")
-            else:
-                today_day_index = len(df_window) - 1
-                logger.info(f"  ✗ Using last date at index {today_day_index}")
+            today_day_index = len(df_window) - 1
+            logger.info(f"  ✗ Using last date at index {today_day_index}")
 
         # Get data at the found index
         today_data = df_window.iloc[today_day_index]
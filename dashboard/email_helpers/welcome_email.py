@@ -1,22 +1,7 @@
-from datetime import datetime
+import html
 
-
-def welcome_email(name: str) -> str:
-    """
-    Return a mobile-friendly HTML welcome email for a new user subscribing to
-    daily Bitcoin purchasing updates.
-
-    Args:
-        name: Recipient's name (string). Will be HTML-escaped for safety.
-
-    Returns:
-        A string containing the HTML email.
-    """
-    import html
-
-    n = html.escape(name) if name else "Friend"
-
-    return f"""<!doctype html>
+# Static welcome template; the recipient name is substituted for __NAME__
+_WELCOME_HTML_TEMPLATE = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -24,41 +9,41 @@ def welcome_email(name: str) -> str:
   <title>Welcome — Daily BTC Accumulation</title>
   <style>
     /* Basic reset */
-    body,table,td,a{{-webkit-text-size-adjust:100%;-ms-text-size-adjust:100%;}}
-    table,td{{mso-table-lspace:0pt;mso-table-rspace:0pt;}}
-    img{{-ms-interpolation-mode:bicubic;}}
-    img{{border:0;height:auto;line-height:100%;outline:none;text-decoration:none;}}
-    a[x-apple-data-detectors]{{color:inherit;text-decoration:none;font-size:inherit;font-family:inherit;font-weight:inherit;line-height:inherit;}}
+    body,table,td,a{-webkit-text-size-adjust:100%;-ms-text-size-adjust:100%;}
+    table,td{mso-table-lspace:0pt;mso-table-rspace:0pt;}
+    img{-ms-interpolation-mode:bicubic;}
+    img{border:0;height:auto;line-height:100%;outline:none;text-decoration:none;}
+    a[x-apple-data-detectors]{color:inherit;text-decoration:none;font-size:inherit;font-family:inherit;font-weight:inherit;line-height:inherit;}
 
     /* Container and typography */
-    body{{margin:0;padding:0;width:100% !important;background-color:#f4f6f8;font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;}}
-    .email-wrapper{{width:100%;background-color:#f4f6f8;padding:20px 0;}}
-    .email-content{{max-width:600px;margin:0 auto;background-color:#ffffff;border-radius:8px;overflow:hidden;box-shadow:0 4px 14px rgba(20,20,30,0.06);}}
+    body{margin:0;padding:0;width:100% !important;background-color:#f4f6f8;font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;}
+    .email-wrapper{width:100%;background-color:#f4f6f8;padding:20px 0;}
+    .email-content{max-width:600px;margin:0 auto;background-color:#ffffff;border-radius:8px;overflow:hidden;box-shadow:0 4px 14px rgba(20,20,30,0.06);}
 
-    .header{{padding:20px;text-align:center;background:linear-gradient(90deg,#0f172a,#0b1220);color:#ffffff;}}
-    .logo{{font-weight:700;font-size:20px;letter-spacing:0.4px;}}
-    .preheader{{display:none !important;visibility:hidden;opacity:0;height:0;width:0;mso-hide:all;overflow:hidden;}} /* hidden preview text */
+    .header{padding:20px;text-align:center;background:linear-gradient(90deg,#0f172a,#0b1220);color:#ffffff;}
+    .logo{font-weight:700;font-size:20px;letter-spacing:0.4px;}
+    .preheader{display:none !important;visibility:hidden;opacity:0;height:0;width:0;mso-hide:all;overflow:hidden;} /* hidden preview text */
 
-    .content{{padding:28px 24px 20px 24px;color:#0f172a;}}
-    .greeting{{font-size:18px;margin:0 0 10px 0;font-weight:600;}}
-    .lead{{font-size:15px;line-height:1.45;margin:0 0 18px 0;color:#334155;}}
+    .content{padding:28px 24px 20px 24px;color:#0f172a;}
+    .greeting{font-size:18px;margin:0 0 10px 0;font-weight:600;}
+    .lead{font-size:15px;line-height:1.45;margin:0 0 18px 0;color:#334155;}
 
-    .card{{background-color:#f8fafc;border-radius:8px;padding:14px;margin:18px 0;color:#0b1220;font-size:14px;line-height:1.4;}}
-    .cta-wrap{{text-align:center;margin:20px 0 10px 0;}}
-    .button{{display:inline-block;padding:12px 20px;border-radius:8px;background-color:#f7931a;color:white;text-decoration:none;font-weight:600;font-size:15px;}}
-    .muted{{color:#64748b;font-size:13px;margin-top:12px;}}
+    .card{background-color:#f8fafc;border-radius:8px;padding:14px;margin:18px 0;color:#0b1220;font-size:14px;line-height:1.4;}
+    .cta-wrap{text-align:center;margin:20px 0 10px 0;}
+    .button{display:inline-block;padding:12px 20px;border-radius:8px;background-color:#f7931a;color:white;text-decoration:none;font-weight:600;font-size:15px;}
+    .muted{color:#64748b;font-size:13px;margin-top:12px;}
 
-    .footer{{padding:18px 24px;background-color:#ffffff;border-top:1px solid #eef2f7;color:#94a3b8;font-size:12px;text-align:center;}}
-    .small{{font-size:12px;color:#94a3b8;line-height:1.4;}}
+    .footer{padding:18px 24px;background-color:#ffffff;border-top:1px solid #eef2f7;color:#94a3b8;font-size:12px;text-align:center;}
+    .small{font-size:12px;color:#94a3b8;line-height:1.4;}
 
     /* Responsive tweaks */
-    @media only screen and (max-width:480px){{ 
-      .content{{padding:20px 16px;}}
-      .header{{padding:16px;}}
-      .logo{{font-size:18px;}}
-      .greeting{{font-size:16px;}}
-      .button{{width:100%;display:block;padding:12px 14px;}}
-    }}
+    @media only screen and (max-width:480px){ 
+      .content{padding:20px 16px;}
+      .header{padding:16px;}
+      .logo{font-size:18px;}
+      .greeting{font-size:16px;}
+      .button{width:100%;display:block;padding:12px 14px;}
+    }
   </style>
 </head>
 <body>
@@ -81,7 +66,7 @@ def welcome_email(name: str) -> str:
           <!-- Body -->
           <tr>
             <td class="content">
-              <p class="greeting">Hi {n},</p>
+              <p class="greeting">Hi __NAME__,</p>
               <p class="lead">
                 Welcome — thanks for subscribing to daily Bitcoin purchasing updates. Every afternoon you'll receive a clear note with that day's suggested buy amount,
                 the current BTC price, and a short market snapshot so you can stay informed.
@@ -129,4 +114,20 @@ def welcome_email(name: str) -> str:
 </html>"""
 
 
+def welcome_email(name: str) -> str:
+    """
+    Return a mobile-friendly HTML welcome email for a new user subscribing to
+    daily Bitcoin purchasing updates.
+
+    Args:
+        name: Recipient's name (string). Will be HTML-escaped for safety.
+
+    Returns:
+        A string containing the HTML email.
+    """
+    n = html.escape(name) if name else "Friend"
+
+    return _WELCOME_HTML_TEMPLATE.replace("__NAME__", n)
+
+
 # print(welcome_email("Sam"))
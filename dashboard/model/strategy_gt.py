@@ -12,9 +12,10 @@ The model uses a 23-parameter system with:
 Performance: 99.4% win rate against uniform DCA across 4,750+ rolling windows since 2011
 """
 
+import math
+
 import pandas as pd
 import numpy as np
-from scipy.stats import beta
 
 # Framework constants
 MIN_WEIGHT = 1e-5
@@ -22,6 +23,12 @@ WINDOWS = [30, 90, 180, 365, 1461]
 FEATURES = [f"z{w}" for w in WINDOWS]
 PROTOTYPES = [(0.5, 5.0), (1.0, 1.0), (5.0, 0.5)]
 
+# Beta function normalisers B(a, b) = Γ(a)Γ(b) / Γ(a + b) for each prototype,
+# so the pdf can be evaluated in closed form without importing scipy.stats
+_PROTOTYPE_NORMS = [
+    math.gamma(a) * math.gamma(b) / math.gamma(a + b) for a, b in PROTOTYPES
+]
+
 # Optimized theta parameters from the final model run (94.5% score)
 THETA = np.array(
     [
@@ -51,6 +58,15 @@ THETA = np.array(
     ]
 )
 
+# Split theta into alpha and beta parameters once at import
+ALPHA = THETA[:18].reshape(3, 6).copy()  # 3x6 matrix for strategic layer
+BETA_V = THETA[18:].copy()  # 5-element vector for tactical layer
+
+# Strategic layer split into bias column and feature weights, so the per-call
+# mix is a (3x5) @ (5,) product without building a fresh [1, feats] vector
+_ALPHA_BIAS = ALPHA[:, 0].copy()
+_ALPHA_FEATS = ALPHA[:, 1:].copy()
+
 # Global cache for features to avoid recomputation
 _FULL_FEATURES = None
 
@@ -61,6 +77,16 @@ def softmax(x: np.ndarray) -> np.ndarray:
     return ex / ex.sum()
 
 
+def _softmax3(a: float, b: float, c: float) -> tuple:
+    """Scalar softmax for the 3-prototype strategic mix (avoids numpy overhead)."""
+    m = max(a, b, c)
+    ea = math.exp(a - m)
+    eb = math.exp(b - m)
+    ec = math.exp(c - m)
+    s = ea + eb + ec
+    return (ea / s, eb / s, ec / s)
+
+
 def allocate_sequential(raw: np.ndarray) -> np.ndarray:
     """
     Strict left-to-right 'drain' allocator.
@@ -86,13 +112,19 @@ def allocate_sequential(raw: np.ndarray) -> np.ndarray:
     return w / w.sum()
 
 
+def _beta_pdf(t: np.ndarray, k: int) -> np.ndarray:
+    """Closed-form Beta pdf for prototype k on the open interval (0, 1)."""
+    a, b = PROTOTYPES[k]
+    return t ** (a - 1.0) * (1.0 - t) ** (b - 1.0) / _PROTOTYPE_NORMS[k]
+
+
 def beta_mix_pdf(n: int, mix: np.ndarray) -> np.ndarray:
     """Generates a smooth baseline curve from a mixture of Beta distributions."""
     t = np.linspace(0.5 / n, 1 - 0.5 / n, n)
     return (
-        mix[0] * beta.pdf(t, *PROTOTYPES[0])
-        + mix[1] * beta.pdf(t, *PROTOTYPES[1])
-        + mix[2] * beta.pdf(t, *PROTOTYPES[2])
+        mix[0] * _beta_pdf(t, 0)
+        + mix[1] * _beta_pdf(t, 1)
+        + mix[2] * _beta_pdf(t, 2)
     ) / n
 
 
@@ -172,13 +204,10 @@ def compute_weights(df_window: pd.DataFrame) -> pd.Series:
         n_days = len(df_window)
         return pd.Series(1.0 / n_days, index=df_window.index)
 
-    # Split theta into alpha and beta parameters
-    alpha = THETA[:18].reshape(3, 6)  # 3x6 matrix for strategic layer
-    beta_v = THETA[18:]  # 5-element vector for tactical layer
-
     # Use features from the first day to set the annual strategy
     first_day_feats = feat_slice[FEATURES].iloc[0].values
-    mix = softmax(alpha @ np.r_[1, first_day_feats])
+    v = _ALPHA_FEATS @ first_day_feats + _ALPHA_BIAS
+    mix = np.array(_softmax3(v[0], v[1], v[2]))
 
     # Calculate the components of the allocation formula
     n_days = len(feat_slice)
@@ -188,17 +217,17 @@ def compute_weights(df_window: pd.DataFrame) -> pd.Series:
     dynamic_features = feat_slice[FEATURES].values.copy()
     if "Type" in df_window.columns:
         # Find last historical index
-        historical_mask = df_window["Type"] == "Historical"
+        historical_mask = df_window["Type"].to_numpy() == "Historical"
         if historical_mask.any():
-            last_hist_idx = historical_mask[::-1].idxmax()
-            last_hist_position = df_window.index.get_loc(last_hist_idx)
-            last_hist_features = feat_slice[FEATURES].iloc[last_hist_position].values
+            # Position of the last historical row, straight from the mask
+            last_hist_position = len(historical_mask) - 1 - historical_mask[::-1].argmax()
 
             # Use last historical features for all future dates
-            for i in range(last_hist_position + 1, len(dynamic_features)):
-                dynamic_features[i] = last_hist_features
+            dynamic_features[last_hist_position + 1 :] = dynamic_features[
+                last_hist_position
+            ]
 
-    dynamic_signal = np.exp(-(dynamic_features @ beta_v))
+    dynamic_signal = np.exp(-(dynamic_features @ BETA_V))
 
     # Combine signals and compute final weights
     raw_weights = base_alloc * dynamic_signal
@@ -256,18 +285,22 @@ def validate_gt_weights(weights: pd.Series) -> dict:
     """
     results = {"valid": True, "errors": [], "warnings": []}
 
+    # One min and one sum pass cover all three checks
+    w = weights.to_numpy(dtype=float)
+    min_weight = np.nanmin(w) if w.size else np.inf
+
     # Check for non-positive weights
-    if (weights <= 0).any():
+    if min_weight <= 0:
         results["valid"] = False
         results["errors"].append("Found non-positive weights")
 
     # Check minimum weight constraint
-    if (weights < MIN_WEIGHT).any():
+    if min_weight < MIN_WEIGHT:
         results["valid"] = False
         results["errors"].append(f"Found weights below MIN_WEIGHT ({MIN_WEIGHT})")
 
     # Check sum to 1.0
-    weight_sum = weights.sum()
+    weight_sum = np.nansum(w)
     if not np.isclose(weight_sum, 1.0, rtol=1e-5, atol=1e-8):
         results["warnings"].append(f"Weights sum to {weight_sum:.6f} (expected 1.0)")
 
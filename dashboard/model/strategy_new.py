@@ -16,6 +16,13 @@ import numpy as np
 # Minimum weight per period (framework requirement)
 MIN_WEIGHT = 1e-5
 
+# Market regime lookup indexed by [trend (bear/sideways/bull)][volatility (low/high)]
+_REGIMES = (
+    ("Bear Market (Low Vol)", "Bear Market (High Vol)"),
+    ("Sideways/Consolidation", "Sideways/Consolidation"),
+    ("Bull Market (Low Vol)", "Bull Market (High Vol)"),
+)
+
 
 def construct_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -33,25 +40,28 @@ def construct_features(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with added feature columns: ma200, std200
     """
-    df = df.copy()
-
     # Ensure we have PriceUSD column
     if "PriceUSD" not in df.columns:
         raise ValueError("DataFrame must contain 'PriceUSD' column")
 
-    df = df[["PriceUSD"]]
+    price = df["PriceUSD"]
 
     # CRITICAL: Shift by 1 to avoid look-ahead bias
     # When making decision for day T, we only know prices up to day T-1
-    past_price = df["PriceUSD"].shift(1)
-
-    # Calculate 200-day moving average (long-term trend)
-    df["ma200"] = past_price.rolling(window=200, min_periods=1).mean()
-
-    # Calculate 200-day standard deviation (volatility measure)
-    df["std200"] = past_price.rolling(window=200, min_periods=1).std()
-
-    return df
+    past_price = price.shift(1)
+    rolling = past_price.rolling(window=200, min_periods=1)
+
+    # Build the output directly from arrays instead of copying the input frame
+    return pd.DataFrame(
+        {
+            "PriceUSD": price.to_numpy(),
+            # 200-day moving average (long-term trend)
+            "ma200": rolling.mean().to_numpy(),
+            # 200-day standard deviation (volatility measure)
+            "std200": rolling.std().to_numpy(),
+        },
+        index=df.index,
+    )
 
 
 def compute_weights(df_window: pd.DataFrame, boost_alpha: float = 1.25) -> pd.Series:
@@ -101,16 +111,26 @@ def compute_weights(df_window: pd.DataFrame, boost_alpha: float = 1.25) -> pd.Se
     ma200_array = features["ma200"].values
     std200_array = features["std200"].values
 
+    # Valid signal days (finite data, non-zero volatility, price below trend),
+    # computed once instead of per-day NaN checks inside the loop
+    with np.errstate(invalid="ignore"):
+        valid = (
+            np.isfinite(ma200_array)
+            & np.isfinite(std200_array)
+            & (std200_array > 0)
+            & (price_array < ma200_array)
+        )
+
     # 5. Main loop: Identify buy opportunities and boost weights
     for day_idx in range(total_days):
+        # Skip if no valid signal (missing data or price above trend)
+        if not valid[day_idx]:
+            continue
+
         price = price_array[day_idx]
         ma200 = ma200_array[day_idx]
         std200 = std200_array[day_idx]
 
-        # Skip if no valid signal (missing data or price above trend)
-        if pd.isna(ma200) or pd.isna(std200) or std200 == 0 or price >= ma200:
-            continue
-
         # Calculate Z-score: How many standard deviations below MA200?
         # Higher Z-score = bigger dip = stronger buy signal
         z_score = (ma200 - price) / std200
@@ -122,25 +142,25 @@ def compute_weights(df_window: pd.DataFrame, boost_alpha: float = 1.25) -> pd.Se
         # Redistribute excess over the last half of the window
         # This ensures we don't "create money" - we take from future days
         start_redistribution = max(total_days - rebalance_window, day_idx + 1)
-        redistribution_indices = np.arange(start_redistribution, total_days)
+        n_redistribution = total_days - start_redistribution
 
         # If no days available to redistribute from, skip this boost
-        if redistribution_indices.size == 0:
+        if n_redistribution <= 0:
             continue
 
         # Calculate how much to reduce each future day
-        per_day_reduction = excess / redistribution_indices.size
+        per_day_reduction = excess / n_redistribution
+
+        # Slice view of the redistribution days (no index-array allocation)
+        future_weights = temp_weights[start_redistribution:total_days]
 
         # Safety check: Ensure no weight falls below MIN_WEIGHT
         # This prevents mathematical errors and ensures we're always in the market
-        future_weights_after_reduction = (
-            temp_weights[redistribution_indices] - per_day_reduction
-        )
-
-        if np.all(future_weights_after_reduction >= MIN_WEIGHT):
+        # (the smallest future weight is the only one that can fail the check)
+        if future_weights.min() - per_day_reduction >= MIN_WEIGHT:
             # Safe to apply the boost and redistribution
             temp_weights[day_idx] = boosted_weight
-            temp_weights[redistribution_indices] -= per_day_reduction
+            future_weights -= per_day_reduction
         # else: skip this boost to maintain weight constraints
 
     # 7. Assign the computed numpy array back into a pandas Series
@@ -174,18 +194,22 @@ def compute_z_scores(df: pd.DataFrame) -> pd.Series:
         Series of Z-scores (0 if price >= MA200)
     """
     features = construct_features(df)
-    z_scores = pd.Series(0.0, index=df.index, dtype=float)
-
-    for idx in range(len(df)):
-        price = features.iloc[idx]["PriceUSD"]
-        ma200 = features.iloc[idx]["ma200"]
-        std200 = features.iloc[idx]["std200"]
-
-        # Calculate Z-score only when all data is valid and price < MA200
-        if pd.notna(ma200) and pd.notna(std200) and std200 > 0 and price < ma200:
-            z_scores.iloc[idx] = (ma200 - price) / std200
+    price = features["PriceUSD"].to_numpy(dtype=float)
+    ma200 = features["ma200"].to_numpy(dtype=float)
+    std200 = features["std200"].to_numpy(dtype=float)
+
+    # Calculate Z-score only when all data is valid and price < MA200,
+    # comparing raw arrays so pandas never aligns indexes
+    with np.errstate(invalid="ignore", divide="ignore"):
+        valid = (
+            np.isfinite(ma200)
+            & np.isfinite(std200)
+            & (std200 > 0)
+            & (price < ma200)
+        )
+        z = np.where(valid, (ma200 - price) / std200, 0.0)
 
-    return z_scores
+    return pd.Series(z, index=df.index, dtype=float)
 
 
 def get_buy_signal_strength(z_score: float) -> str:
@@ -228,17 +252,21 @@ def calculate_portfolio_metrics(
     total_btc = 0
     total_spent = 0
 
+    # Plain ndarrays outside the loop; per-row .iloc[i]["col"] boxes a Series
+    prices = df_price["PriceUSD"].to_numpy()
+    weight_values = weights.to_numpy()
+
     # Simulate daily purchases
     for i in range(min(current_day + 1, len(df_price))):
-        price = df_price.iloc[i]["PriceUSD"]
-        weight = weights.iloc[i]
+        price = prices[i]
+        weight = weight_values[i]
         amount = budget * weight
         btc_bought = amount / price if price > 0 else 0
         total_btc += btc_bought
         total_spent += amount
 
     # Calculate current portfolio value
-    current_price = df_price.iloc[current_day]["PriceUSD"]
+    current_price = prices[current_day]
     portfolio_value = total_btc * current_price
 
     # Calculate profit/loss
@@ -312,25 +340,23 @@ def get_market_regime(df: pd.DataFrame, lookback: int = 30) -> str:
         return "Insufficient Data"
 
     # Calculate returns for recent period
-    recent = df.iloc[-lookback:]
-    returns = recent["PriceUSD"].pct_change().dropna()
+    prices = df["PriceUSD"].to_numpy(dtype=float)[-lookback:]
+    returns = prices[1:] / prices[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
 
-    # Calculate statistics
-    mean_return = returns.mean()
-    volatility = returns.std()
-
-    # Classify regime
-    if mean_return > 0.01 and volatility < 0.03:
-        return "Bull Market (Low Vol)"
-    elif mean_return > 0.01 and volatility >= 0.03:
-        return "Bull Market (High Vol)"
-    elif mean_return < -0.01 and volatility < 0.03:
-        return "Bear Market (Low Vol)"
-    elif mean_return < -0.01 and volatility >= 0.03:
-        return "Bear Market (High Vol)"
-    else:
+    # Fewer than two returns leaves volatility undefined
+    if returns.size < 2:
         return "Sideways/Consolidation"
 
+    # Calculate statistics (ddof=1 to match pandas' sample std)
+    mean_return = returns.mean()
+    volatility = returns.std(ddof=1)
+
+    # Classify regime: row by trend direction, column by volatility bucket
+    trend = int(mean_return > 0.01) - int(mean_return < -0.01) + 1
+    vol_bucket = int(volatility >= 0.03)
+    return _REGIMES[trend][vol_bucket]
+
 
 def validate_weights(weights: pd.Series) -> dict:
     """
@@ -349,18 +375,22 @@ def validate_weights(weights: pd.Series) -> dict:
     """
     results = {"valid": True, "errors": [], "warnings": []}
 
+    # One min and one sum pass cover all three checks
+    w = weights.to_numpy(dtype=float)
+    min_weight = np.nanmin(w) if w.size else np.inf
+
     # Check for non-positive weights
-    if (weights <= 0).any():
+    if min_weight <= 0:
         results["valid"] = False
         results["errors"].append("Found non-positive weights")
 
     # Check minimum weight constraint
-    if (weights < MIN_WEIGHT).any():
+    if min_weight < MIN_WEIGHT:
         results["valid"] = False
         results["errors"].append(f"Found weights below MIN_WEIGHT ({MIN_WEIGHT})")
 
     # Check sum to 1.0
-    weight_sum = weights.sum()
+    weight_sum = np.nansum(w)
     if not np.isclose(weight_sum, 1.0, rtol=1e-5, atol=1e-8):
         results["warnings"].append(f"Weights sum to {weight_sum:.6f} (expected 1.0)")
 
@@ -1,308 +1,229 @@
 import streamlit as st
-import os
+from bisect import bisect_right
 
-# from dashboard.backend.gsheet_utils import get_user_info_by_email
-from dashboard.backend.supabase_utils import get_user_info_by_email, initialize_database
+from dashboard.sidebar_content import (
+    ABOUT_BASE_MD,
+    ABOUT_GT_MD,
+    STATIC_SIDEBAR_HTML,
+    STATIC_SIDEBAR_SIMPLIFIED_HTML,
+)
 
-from dashboard.ui.update_modal import modal
 
+DEFAULT_MODEL = "GT-MSA-S25-Trilemma Model"
 
-url = os.getenv("SUPABASE_URL")
-key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-db = initialize_database(url, key)
+# Boost factor interpretation: _BOOST_DESC[i] applies below _BOOST_THRESH[i]
+_BOOST_THRESH = (1.0, 1.5, 2.0)
+_BOOST_DESC = (
+    "Conservative - Minimal deviation from DCA",
+    "Moderate - Balanced approach",
+    "Aggressive - Strong dip buying",
+    "Very Aggressive - Maximum dip concentration",
+)
 
 
-def render_sidebar():
-    """
-    Render sidebar with user inputs and configuration options.
+def _get_defaults(user_info: dict) -> dict:
+    """Default widget values, overridden by the logged-in user's saved info."""
+    defaults = {"budget": 1000, "investment_window": 12, "boost_alpha": 1.25}
 
-    Returns:
-        Dictionary containing all user-selected parameters
-    """
+    if user_info:
+        try:
+            defaults["budget"] = int(float(user_info.get("budget", 1000)))
+            defaults["investment_window"] = int(user_info.get("investment_period", 12))
+            defaults["boost_alpha"] = float(user_info.get("boost_factor", 1.25))
+        except (ValueError, TypeError, KeyError):
+            # If any conversion fails, keep defaults
+            pass
 
-    # if the user is logged in, retrieve their budget info
-    logged_in = False
-    st.session_state.user_info = {}
-    if st.user.get("email"):
-        logged_in = True
-        user_info = get_user_info_by_email(st.user.get("email"))
-        st.session_state.user_info = user_info if user_info else {}
+    return defaults
 
-    with st.sidebar:
-        # Logo and branding
-
-        # st.title("⚙️ Configuration")
-        # st.markdown("---")
-
-        # Investment Parameters
-        st.markdown("### Investment Parameters")
-        if st.user.get("email"):
-            modal(st.user.get("email"))
-
-        # Set default values
-        default_budg_val = 1000
-        default_invest_window = 12
-        default_boost_val = 1.25
-
-        # Override with user values if logged in and user_info exists
-        if logged_in and user_info:
-            try:
-                default_budg_val = int(float(user_info.get("budget", 1000)))
-                default_invest_window = int(user_info.get("investment_period", 12))
-                default_boost_val = float(user_info.get("boost_factor", 1.25))
-            except (ValueError, TypeError, KeyError):
-                # If any conversion fails, keep defaults
-                pass
-
-        budget = st.number_input(
-            "Total Budget (USD)",
-            min_value=100,
-            max_value=10_000_000,
-            value=default_budg_val,
-            step=100,
-            help="Total amount you want to invest over the accumulation period",
-        )
 
-        investment_window = st.number_input(
-            "Investment window (months)",
-            min_value=1,
-            max_value=24,
-            value=default_invest_window,
-            step=1,
-            help="Amount of months for your investment period",
-        )
+def _render_investment_params(defaults: dict) -> tuple:
+    """
+    Render budget and investment window inputs with the derived breakdown.
 
-        # Show derived metrics (Now dynamic)
+    Returns:
+        Tuple of (budget, investment_window, daily_avg, monthly_avg)
+    """
+    budget = st.number_input(
+        "Total Budget (USD)",
+        min_value=100,
+        max_value=10_000_000,
+        value=defaults["budget"],
+        step=100,
+        help="Total amount you want to invest over the accumulation period",
+    )
+
+    investment_window = st.number_input(
+        "Investment window (months)",
+        min_value=1,
+        max_value=24,
+        value=defaults["investment_window"],
+        step=1,
+        help="Amount of months for your investment period",
+    )
+
+    # Show derived metrics, recomputed only when the inputs change
+    breakdown_key = (budget, investment_window)
+    if st.session_state.get("_breakdown_key") != breakdown_key:
         if investment_window > 0:
             days_in_period = investment_window * 30.44  # Average days/month
-            daily_avg = budget / days_in_period
-            monthly_avg = budget / investment_window
+            breakdown = (budget / days_in_period, budget / investment_window)
         else:
-            daily_avg = monthly_avg = 0
-
-        st.markdown(
-            f"""
-        **Breakdown:**
-        - Approx. Daily (DCA): ${daily_avg:,.2f}
-        - Monthly: ${monthly_avg:,.2f}
-        """
+            breakdown = (0, 0)
+        st.session_state["_breakdown_key"] = breakdown_key
+        st.session_state["_breakdown_vals"] = breakdown
+    daily_avg, monthly_avg = st.session_state["_breakdown_vals"]
+
+    # Plain text, two numeric lines don't need the markdown renderer
+    st.text(
+        f"Breakdown:\n"
+        f"  Approx. Daily (DCA): ${daily_avg:,.2f}\n"
+        f"  Monthly: ${monthly_avg:,.2f}"
+    )
+
+    return budget, investment_window, daily_avg, monthly_avg
+
+
+def _render_strategy_params(defaults: dict, model_choice: str) -> float:
+    """
+    Render the strategy parameter controls for the selected model.
+
+    Returns:
+        The boost factor (α) to use for weight computation
+    """
+    st.markdown("### Strategy Parameters")
+
+    # Only show boost_alpha for current model
+    if model_choice == "Base Model":
+        boost_alpha = st.slider(
+            "Boost Factor (α)",
+            0.5,
+            5.0,
+            defaults["boost_alpha"],
+            0.05,
+            help="Controls how aggressively to buy during dips.",
+        )
+        st.info(
+            "ℹ️ Choose your boost factor for the base model (71.6% final score with α=1.25)"
+        )
+    else:
+        # For GT model, set a default (model doesn't use this parameter)
+        boost_alpha = 1.25
+        st.info(
+            "ℹ️ GT-MSA-S25-Trilemma model uses optimized parameters (94.5% final score)"
         )
+
+    # Show boost factor interpretation only for current model
+    if model_choice == "Base Model":
+        boost_desc = _BOOST_DESC[bisect_right(_BOOST_THRESH, boost_alpha)]
+        st.caption(f"*{boost_desc}*")
+
+    return boost_alpha
+
+
+def _render_info_sections(model_choice: str, model_selection: bool = True):
+    """Render the About expander and the static reference sections."""
+    # Only build the body once the user has opened the expander
+    about_expander = st.expander(
+        "ℹ️ About This Strategy", key="exp_about", on_change="rerun"
+    )
+    if about_expander.open:
+        with about_expander:
+            if model_choice == "Base Model":
+                st.markdown(ABOUT_BASE_MD)
+            else:
+                st.markdown(ABOUT_GT_MD)
+
+    # Reference sections (static, rendered as one pre-built HTML block)
+    st.html(STATIC_SIDEBAR_HTML if model_selection else STATIC_SIDEBAR_SIMPLIFIED_HTML)
+
+
+def render_sidebar(model_selection: bool = True):
+    """
+    Render sidebar with user inputs and configuration options.
+
+    Args:
+        model_selection: Show the model picker and strategy parameters. When
+            False the sidebar is the simplified variant fixed to the GT model.
+
+    Returns:
+        Dictionary containing all user-selected parameters
+    """
+    st.session_state["_sidebar_in_app_run"] = True
+    with st.sidebar:
+        _render_sidebar_fragment(model_selection)
+
+    return st.session_state["sidebar_params"]
+
+
+@st.fragment
+def _render_sidebar_fragment(model_selection: bool):
+    """
+    Sidebar body, isolated so expander toggles and widget edits rerun only
+    the sidebar. Stores the selected parameters in st.session_state.sidebar_params.
+    """
+    # False when Streamlit reruns just this fragment
+    in_app_run = st.session_state.pop("_sidebar_in_app_run", False)
+
+    # if the user is logged in, retrieve their budget info (kept in session
+    # state and only refetched when the email changes or the modal saves)
+    user_email = st.user.get("email")
+    st.session_state.setdefault("user_info", {})
+    if st.session_state.get("_user_info_email") != user_email:
+        st.session_state.user_info = {}
+    if user_email:
+        # Imported here so anonymous sessions never load the Supabase client
+        from dashboard.backend.supabase_utils import get_cached_user_info
+        from dashboard.ui.update_modal import modal
+
+        if st.session_state.get("_user_info_email") != user_email:
+            user_info = get_cached_user_info(user_email)
+            st.session_state.user_info = user_info if user_info else {}
+    st.session_state["_user_info_email"] = user_email
+
+    # Investment Parameters
+    st.markdown("### Investment Parameters")
+    if user_email:
+        modal(user_email)
+
+    defaults = _get_defaults(st.session_state.user_info)
+    budget, investment_window, daily_avg, monthly_avg = _render_investment_params(
+        defaults
+    )
+
+    if model_selection:
         st.markdown("---")
 
         # Model Selection
         st.markdown("### Model Selection")
         model_choice = st.selectbox(
             "Choose Strategy Model",
-            options=["Base Model", "GT-MSA-S25-Trilemma Model"],
+            options=["Base Model", DEFAULT_MODEL],
             index=1,
             help="Select which Bitcoin accumulation model to use",
         )
 
         st.markdown("---")
 
-        # Strategy Parameters (code unchanged)
-        st.markdown("### Strategy Parameters")
-
-        # Only show boost_alpha for current model
-        if model_choice == "Base Model":
-            boost_alpha = st.slider(
-                "Boost Factor (α)",
-                0.5,
-                5.0,
-                default_boost_val,
-                0.05,
-                help="Controls how aggressively to buy during dips.",
-            )
-            st.info(
-                "ℹ️ Choose your boost factor for the base model (71.6% final score with α=1.25)"
-            )
-        else:
-            # For GT model, set a default (model doesn't use this parameter)
-            boost_alpha = 1.25
-            st.info(
-                "ℹ️ GT-MSA-S25-Trilemma model uses optimized parameters (94.5% final score)"
-            )
-
-        # Show boost factor interpretation only for current model
-        if model_choice == "Base Model":
-            if boost_alpha < 1.0:
-                boost_desc = "Conservative - Minimal deviation from DCA"
-            elif boost_alpha < 1.5:
-                boost_desc = "Moderate - Balanced approach"
-            elif boost_alpha < 2.0:
-                boost_desc = "Aggressive - Strong dip buying"
-            else:
-                boost_desc = "Very Aggressive - Maximum dip concentration"
+        boost_alpha = _render_strategy_params(defaults, model_choice)
+    else:
+        model_choice = DEFAULT_MODEL
+        boost_alpha = 1.25
 
-            st.caption(f"*{boost_desc}*")
+    st.markdown("---")
 
-        st.markdown("---")
+    # ════════════════════════════════════════════════════════
+    # Information Section
+    # ════════════════════════════════════════════════════════
+    _render_info_sections(model_choice, model_selection)
 
-        # ════════════════════════════════════════════════════════
-        # Information Section
-        # ════════════════════════════════════════════════════════
-        with st.expander("ℹ️ About This Strategy"):
-            if model_choice == "Base Model":
-                st.markdown(
-                    """
-                **Dynamic Buy-The-Dip Approach**
-                
-                This strategy intelligently adjusts daily Bitcoin accumulation based on:
-                
-                🎯 **Key Features:**
-                - 📉 Detects when price drops below 200-day MA
-                - 📊 Measures dip significance using Z-scores
-                - 💰 Allocates more capital during larger dips
-                - ⚖️ Redistributes from future periods
-                - 🎲 Updates beliefs using Bayesian inference
-                """
-                )
-            else:
-                st.markdown(
-                    """
-                **GT-MSA-S25-Trilemma Model (94.5% Final Score)**
-                
-                This sophisticated two-layer system achieved exceptional performance:
-                
-                🎯 **Key Features:**
-                - 🧠 Strategic Layer: Annual investment planning using 5 momentum signals
-                - ⚡ Tactical Layer: Daily adjustments based on market conditions
-                - 📈 99.4% win rate against uniform DCA since 2011
-                - 🔄 Multi-scale cyclical awareness (30d to 4-year signals)
-                - 🎯 23 optimized parameters from rigorous backtesting
-                
-                **Performance Metrics:**
-                - Final Score: 94.5%
-                - Win Rate: 99.4%
-                - Reward-Weighted Percentile: 89.55%
-                - Tested on 4,750+ rolling 365-day windows
-                """
-                )
-
-        # Expandable sections for detailed info
-        with st.expander("📚 Technical Indicators"):
-            st.markdown(
-                """
-            **MA200 (Moving Average):**
-            - 200-day average price
-            - Represents long-term trend
-            - Buy signal when price < MA200
-            
-            **Standard Deviation:**
-            - Measures price volatility
-            - Higher = more volatile market
-            - Used to calculate Z-scores
-            
-            **Z-Score:**
-            - Statistical measure of price deviation
-            - Formula: (MA200 - Price) / StdDev
-            - Higher = stronger buy signal
-            
-            **Weight:**
-            - Percentage of budget for each day
-            - All weights sum to 1.0 (100%)
-            - Dynamic: higher on dip days
-            """
-            )
-
-        with st.expander("💡 Signal Interpretation"):
-            st.markdown(
-                """
-            **Z-Score Ranges:**
-            - `0.0-0.5`: Weak signal
-            - `0.5-1.0`: Moderate signal
-            - `1.0-1.5`: Strong signal
-            - `1.5-2.0`: Very strong signal
-            - `2.0+`: Extreme opportunity
-            
-            **Weight Boosting:**
-            - Base weight × (1 + α × Z-score)
-            - Higher α = more aggressive
-            - Excess redistributed to future days
-            
-            **Example:**
-            - Z-score = 2.0, α = 1.25
-            - Boost = 1 + (1.25 × 2.0) = 3.5×
-            - Weight increases by 250%
-            """
-            )
-
-        # with st.expander("🧠 Bayesian Learning"):
-        #     st.markdown(
-        #         """
-        #     The model continuously learns from new data:
-
-        #     **How it works:**
-        #     1. Starts with neutral prior beliefs
-        #     2. Observes recent price movements
-        #     3. Updates beliefs using Bayes' theorem
-        #     4. Confidence increases over time
-
-        #     **Key Metrics:**
-        #     - **Prior Mean**: Expected return
-        #     - **Prior Variance**: Uncertainty
-        #     - **Confidence**: 1/Variance
-
-        #     As more data arrives, variance decreases
-        #     and confidence increases, leading to more
-        #     refined predictions.
-        #     """
-        #     )
-
-        with st.expander("⚠️ Risk Considerations"):
-            st.markdown(
-                """
-            **Important Reminders:**
-            
-            ⚠️ This is an educational tool
-            ⚠️ Past performance ≠ future results
-            ⚠️ Cryptocurrency is highly volatile
-            ⚠️ Only invest what you can afford to lose
-            ⚠️ Not financial advice
-            
-            **Best Practices:**
-            - Start with small amounts to test
-            - Understand the strategy logic
-            - Monitor performance regularly
-            - Adjust parameters based on your risk tolerance
-            - Diversify your investments
-            """
-            )
+    st.markdown("---")
 
-        st.markdown("---")
-
-        # ════════════════════════════════════════════════════════
-        # Quick Reference Section
-        # ════════════════════════════════════════════════════════
-        with st.expander("🔍 Quick Reference"):
-            st.markdown(
-                """
-            **Framework Constants:**
-            - Investment Window: 12 months
-            - Purchase Frequency: Daily
-            - Min Weight: 0.00001
-            - Backtest Period: 2011-2025
-            
-            **Performance Metrics:**
-            - **SPD**: Sats-per-dollar (efficiency)
-            - **P&L**: Profit and Loss (returns)
-            - **ROI**: Return on Investment (%)
-            - **BTC**: Total Bitcoin accumulated
-            
-            **Comparison Baseline:**
-            Uniform DCA = investing equal amounts daily
-            (1/365 of budget per day)
-            """
-            )
-
-        st.markdown("---")
-
-        # Footer
-        st.caption("Data sources: CoinMetrics, Coinbase")
-        st.caption("Version 1.0 • Updated 2025")
+    # Footer
+    st.caption("Data sources: CoinMetrics, Coinbase")
+    st.caption("Version 1.0 • Updated 2025")
 
-    # Return all parameters as dictionary
-    return {
+    params = {
         "budget": budget,
         "boost_alpha": boost_alpha,
         "daily_avg": daily_avg,
@@ -310,3 +231,10 @@ def render_sidebar():
         "investment_window": investment_window,
         "model_choice": model_choice,
     }
+
+    # A sidebar widget change only reruns this fragment; escalate to a full
+    # app rerun when the parameters the page depends on actually changed
+    changed = st.session_state.get("sidebar_params") != params
+    st.session_state["sidebar_params"] = params
+    if changed and not in_app_run:
+        st.rerun(scope="app")
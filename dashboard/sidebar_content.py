@@ -0,0 +1,187 @@
+# sidebar_content.py
+"""Static text for the dashboard sidebar, kept out of the rendering code."""
+
+import html
+import re
+
+ABOUT_BASE_MD = """
+**Dynamic Buy-The-Dip Approach**
+
+This strategy intelligently adjusts daily Bitcoin accumulation based on:
+
+🎯 **Key Features:**
+- 📉 Detects when price drops below 200-day MA
+- 📊 Measures dip significance using Z-scores
+- 💰 Allocates more capital during larger dips
+- ⚖️ Redistributes from future periods
+- 🎲 Updates beliefs using Bayesian inference
+"""
+
+ABOUT_GT_MD = """
+**GT-MSA-S25-Trilemma Model (94.5% Final Score)**
+
+This sophisticated two-layer system achieved exceptional performance:
+
+🎯 **Key Features:**
+- 🧠 Strategic Layer: Annual investment planning using 5 momentum signals
+- ⚡ Tactical Layer: Daily adjustments based on market conditions
+- 📈 99.4% win rate against uniform DCA since 2011
+- 🔄 Multi-scale cyclical awareness (30d to 4-year signals)
+- 🎯 23 optimized parameters from rigorous backtesting
+
+**Performance Metrics:**
+- Final Score: 94.5%
+- Win Rate: 99.4%
+- Reward-Weighted Percentile: 89.55%
+- Tested on 4,750+ rolling 365-day windows
+"""
+
+# Markdown source for the static reference sections below the About expander
+TECHNICAL_INDICATORS_MD = """
+**MA200 (Moving Average):**
+- 200-day average price
+- Represents long-term trend
+- Buy signal when price < MA200
+
+**Standard Deviation:**
+- Measures price volatility
+- Higher = more volatile market
+- Used to calculate Z-scores
+
+**Z-Score:**
+- Statistical measure of price deviation
+- Formula: (MA200 - Price) / StdDev
+- Higher = stronger buy signal
+
+**Weight:**
+- Percentage of budget for each day
+- All weights sum to 1.0 (100%)
+- Dynamic: higher on dip days
+"""
+
+SIGNAL_INTERPRETATION_MD = """
+**Z-Score Ranges:**
+- `0.0-0.5`: Weak signal
+- `0.5-1.0`: Moderate signal
+- `1.0-1.5`: Strong signal
+- `1.5-2.0`: Very strong signal
+- `2.0+`: Extreme opportunity
+
+**Weight Boosting:**
+- Base weight × (1 + α × Z-score)
+- Higher α = more aggressive
+- Excess redistributed to future days
+
+**Example:**
+- Z-score = 2.0, α = 1.25
+- Boost = 1 + (1.25 × 2.0) = 3.5×
+- Weight increases by 250%
+"""
+
+RISK_CONSIDERATIONS_MD = """
+**Important Reminders:**
+
+⚠️ This is an educational tool
+⚠️ Past performance ≠ future results
+⚠️ Cryptocurrency is highly volatile
+⚠️ Only invest what you can afford to lose
+⚠️ Not financial advice
+
+**Best Practices:**
+- Start with small amounts to test
+- Understand the strategy logic
+- Monitor performance regularly
+- Adjust parameters based on your risk tolerance
+- Diversify your investments
+"""
+
+QUICK_REFERENCE_MD = """
+**Framework Constants:**
+- Investment Window: 12 months
+- {frequency_label}: Daily
+- Min Weight: 0.00001
+- Backtest Period: 2011-2025
+
+**Performance Metrics:**
+- **SPD**: Sats-per-dollar (efficiency)
+- **P&L**: Profit and Loss (returns)
+- **ROI**: Return on Investment (%)
+- **BTC**: Total Bitcoin accumulated
+
+**Comparison Baseline:**
+Uniform DCA = investing equal amounts daily
+(1/365 of budget per day)
+"""
+
+_SIDEBAR_STYLE = """
+<style>
+    .sidebar-info details {
+        border: 1px solid rgba(250, 250, 250, 0.2);
+        border-radius: 0.5rem;
+        padding: 0.5rem 0.75rem;
+        margin-bottom: 0.75rem;
+    }
+    .sidebar-info summary { cursor: pointer; }
+    .sidebar-info ul { margin: 0 0 0.75rem 0; }
+</style>
+"""
+
+
+def _inline_md_to_html(text: str) -> str:
+    """Escape a line and convert its **bold** and `code` spans."""
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    return re.sub(r"`(.+?)`", r"<code>\1</code>", text)
+
+
+def _md_to_html(md: str) -> str:
+    """
+    Convert the small markdown subset used by the reference sections
+    (bold, inline code, "- " lists and plain lines) to HTML.
+    """
+    parts = []
+    for block in md.strip().split("\n\n"):
+        items, lines = [], []
+        for line in block.strip().splitlines():
+            if line.startswith("- "):
+                items.append(f"<li>{_inline_md_to_html(line[2:])}</li>")
+            else:
+                lines.append(_inline_md_to_html(line))
+        if lines:
+            parts.append(f"<p>{'<br>'.join(lines)}</p>")
+        if items:
+            parts.append("<ul>" + "".join(items) + "</ul>")
+    return "\n".join(parts)
+
+
+def _build_static_sidebar_html(frequency_label: str) -> str:
+    """Assemble the reference sections into one block of <details> elements."""
+    sections = [
+        ("📚 Technical Indicators", TECHNICAL_INDICATORS_MD),
+        ("💡 Signal Interpretation", SIGNAL_INTERPRETATION_MD),
+        ("⚠️ Risk Considerations", RISK_CONSIDERATIONS_MD),
+        None,
+        (
+            "🔍 Quick Reference",
+            QUICK_REFERENCE_MD.format(frequency_label=frequency_label),
+        ),
+    ]
+    body = "\n".join(
+        (
+            "<hr>"
+            if section is None
+            else f"<details>\n<summary>{section[0]}</summary>\n"
+            f"{_md_to_html(section[1])}\n</details>"
+        )
+        for section in sections
+    )
+    return f'{_SIDEBAR_STYLE}<div class="sidebar-info">\n{body}\n</div>\n'
+
+
+# Converted to HTML once at import so reruns skip the per-expander markdown
+# parsing; edit the markdown constants above, not the generated HTML
+STATIC_SIDEBAR_HTML = _build_static_sidebar_html("Purchase Frequency")
+
+# The simplified sidebar (Daily Schedule) has always labelled the frequency
+# line differently in its Quick Reference
+STATIC_SIDEBAR_SIMPLIFIED_HTML = _build_static_sidebar_html("Accumulation Frequency")
@@ -1,80 +1,184 @@
 # simulation.py
+import numpy as np
 import pandas as pd
+import streamlit as st
+
+from dashboard.model.strategy_new import compute_weights
+from dashboard.model.strategy_gt import compute_weights as compute_weights_gt
 
 
 def update_bayesian_belief(prior_mean, prior_var, observation, obs_var):
     """
     Perform Bayesian update given new observation.
     """
-    posterior_var = 1 / (1 / prior_var + 1 / obs_var)
-    posterior_mean = posterior_var * (prior_mean / prior_var + observation / obs_var)
-    return posterior_mean, posterior_var
+    return update_bayesian_belief_batch(prior_mean, prior_var, observation, obs_var)
 
 
-def calculate_sats_per_dollar(price):
-    """Convert USD price to sats per dollar (SPD)"""
-    return (1.0 / price) * 1e8
+def update_bayesian_belief_batch(prior_mean, prior_var, observations, obs_vars):
+    """
+    Apply a sequence of Gaussian observations in one precision-form update.
+
+    Equivalent to calling update_bayesian_belief once per observation, since
+    conjugate Gaussian updates add precisions and precision-weighted means.
+    """
+    observations = np.asarray(observations, dtype=float)
+    obs_precisions = 1 / np.asarray(obs_vars, dtype=float)
 
+    posterior_var = 1 / (1 / prior_var + np.sum(obs_precisions))
+    posterior_mean = posterior_var * (
+        prior_mean / prior_var + np.sum(observations * obs_precisions)
+    )
+    return float(posterior_mean), float(posterior_var)
 
-def simulate_accumulation(df_window, weights, budget, current_day):
+
+def calculate_sats_per_dollar(price):
+    """Convert USD price (scalar or array) to sats per dollar (SPD)"""
+    return np.reciprocal(np.asarray(price, dtype=np.float64)) * 1e8
+
+
+# Ratio / plotted series that _build_performance_frame stores as float32
+_FLOAT32_COLUMNS = frozenset(
+    {"Weight", "PnL_Pct", "Daily_SPD", "Weighted_SPD", "Cumulative_SPD"}
+)
+
+
+def _build_performance_frame(
+    dates,
+    prices,
+    weights,
+    amount_spent,
+    total_spent,
+    remaining_budget,
+    daily_spd,
+    weighted_spd,
+    cumulative_spd,
+):
     """
-    Simulate Bitcoin accumulation given weights and budget.
+    Derive BTC holdings and P&L from per-day spend arrays and assemble the
+    accumulation performance DataFrame shared by all simulation paths.
     """
-    results = []
-    total_btc = 0
-    total_spent = 0
-    cumulative_spd = 0
-
-    for i in range(min(current_day + 1, len(df_window))):
-        date = df_window.index[i]
-        price = df_window.iloc[i]["PriceUSD"]
-        weight = weights.iloc[i]
-
-        amount_to_spend = budget * weight
-        btc_bought = amount_to_spend / price if price > 0 else 0
-        total_btc += btc_bought
-        total_spent += amount_to_spend
-
-        portfolio_value = total_btc * price
+    with np.errstate(divide="ignore", invalid="ignore"):
+        btc_bought = np.where(prices > 0, amount_spent / prices, 0.0)
+        total_btc = np.cumsum(btc_bought)
+
+        portfolio_value = total_btc * prices
         pnl = portfolio_value - total_spent
-        pnl_pct = (pnl / total_spent * 100) if total_spent > 0 else 0
-
-        daily_spd = calculate_sats_per_dollar(price)
-        weighted_spd = weight * daily_spd
-        cumulative_spd += weighted_spd
-
-        avg_entry = total_spent / total_btc if total_btc > 0 else 0
-
-        remaining_weight_sum = (
-            weights.iloc[i + 1 :].sum() if i + 1 < len(weights) else 0
-        )
-        remaining_budget = budget * remaining_weight_sum
-
-        results.append(
-            {
-                "Date": date,
-                "Price": price,
-                "Weight": weight,
-                "Amount_Spent": amount_to_spend,
-                "BTC_Bought": btc_bought,
-                "Total_BTC": total_btc,
-                "Total_Spent": total_spent,
-                "Portfolio_Value": portfolio_value,
-                "Remaining_Budget": remaining_budget,
-                "PnL": pnl,
-                "PnL_Pct": pnl_pct,
-                "Daily_SPD": daily_spd,
-                "Weighted_SPD": weighted_spd,
-                "Cumulative_SPD": cumulative_spd,
-                "Avg_Entry_Price": avg_entry,
-            }
-        )
-
-    return pd.DataFrame(results)
+        pnl_pct = np.where(total_spent > 0, pnl / total_spent * 100, 0.0)
+
+        avg_entry = np.where(total_btc > 0, total_spent / total_btc, 0.0)
+
+    columns = {
+        "Price": prices,
+        "Weight": weights,
+        "Amount_Spent": amount_spent,
+        "BTC_Bought": btc_bought,
+        "Total_BTC": total_btc,
+        "Total_Spent": total_spent,
+        "Portfolio_Value": portfolio_value,
+        "Remaining_Budget": remaining_budget,
+        "PnL": pnl,
+        "PnL_Pct": pnl_pct,
+        "Daily_SPD": daily_spd,
+        "Weighted_SPD": weighted_spd,
+        "Cumulative_SPD": cumulative_spd,
+        "Avg_Entry_Price": avg_entry,
+    }
+
+    # Dollar and BTC amounts stay float64: they are shown to the cent / satoshi
+    # and budgets reach $10M, beyond float32's ~7 significant digits. The
+    # plotted weight, SPD and percentage series are stored as float32 to
+    # shrink the cached and serialized payload
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            **{
+                name: values.astype(np.float32)
+                if name in _FLOAT32_COLUMNS
+                else values.astype(np.float64, copy=False)
+                for name, values in columns.items()
+            },
+        }
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def compute_strategy_weights(df_window, model_choice, boost_alpha):
+    """
+    Daily weights for the selected model over the whole window. They don't
+    depend on current_day, so time-control reruns reuse the cached result.
+    """
+    if model_choice == "GT-MSA-S25-Trilemma Model":
+        return compute_weights_gt(df_window)
+    return compute_weights(df_window, boost_alpha=boost_alpha)
 
 
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
+def simulate_accumulation(df_window, weights, budget, current_day):
+    """
+    Simulate Bitcoin accumulation given weights and budget.
+    """
+    n_days = max(min(current_day + 1, len(df_window)), 0)
+
+    prices = df_window["PriceUSD"].to_numpy(dtype=float)[:n_days]
+    all_weights = weights.to_numpy(dtype=float)
+    w = all_weights[:n_days]
+
+    amount_spent = budget * w
+    total_spent = np.cumsum(amount_spent)
+
+    with np.errstate(divide="ignore"):
+        daily_spd = calculate_sats_per_dollar(prices)
+    weighted_spd = w * daily_spd
+    cumulative_spd = np.cumsum(weighted_spd)
+
+    # Budget left after day i is the sum of all weights strictly after i
+    suffix_weights = np.cumsum(all_weights[::-1])[::-1]
+    remaining_weight_sum = np.append(suffix_weights[1:], 0.0)[:n_days]
+    remaining_budget = budget * remaining_weight_sum
+
+    return _build_performance_frame(
+        df_window.index[:n_days],
+        prices,
+        w,
+        amount_spent,
+        total_spent,
+        remaining_budget,
+        daily_spd,
+        weighted_spd,
+        cumulative_spd,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64, ttl=3600)
 def calculate_uniform_dca_performance(df_window, budget, current_day):
     """Calculate performance metrics for uniform DCA strategy"""
-    uniform_weight = 1.0 / len(df_window)
-    uniform_weights = pd.Series(uniform_weight, index=df_window.index)
-    return simulate_accumulation(df_window, uniform_weights, budget, current_day)
+    total_days = len(df_window)
+    n_days = max(min(current_day + 1, total_days), 0)
+    uniform_weight = 1.0 / total_days
+
+    prices = df_window["PriceUSD"].to_numpy(dtype=float)[:n_days]
+
+    # Constant weights make spend and remaining budget closed-form in the day
+    # number, so only the price-dependent series need cumulative sums
+    day_number = np.arange(1, n_days + 1)
+    w = np.full(n_days, uniform_weight)
+    amount_spent = np.full(n_days, budget * uniform_weight)
+    total_spent = budget * day_number / total_days
+    remaining_budget = budget * (total_days - day_number) / total_days
+
+    with np.errstate(divide="ignore"):
+        daily_spd = calculate_sats_per_dollar(prices)
+    weighted_spd = uniform_weight * daily_spd
+    cumulative_spd = uniform_weight * np.cumsum(daily_spd)
+
+    return _build_performance_frame(
+        df_window.index[:n_days],
+        prices,
+        w,
+        amount_spent,
+        total_spent,
+        remaining_budget,
+        daily_spd,
+        weighted_spd,
+        cumulative_spd,
+    )
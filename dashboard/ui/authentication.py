@@ -1,11 +1,70 @@
 import streamlit as st
 
-# from dashboard.backend.gsheet_utils import add_user_info_to_sheet, does_user_exist
-from dashboard.backend.supabase_utils import add_user_info_to_sheet, does_user_exist
-
 from dashboard.config import get_today  # Use the centralized get_today() constant
 
 
+# Static styles for the profile dropdown, sent as raw HTML (no markdown parse)
+_PROFILE_CSS = """
+<style>
+    .profile-dropdown {
+        position: fixed;
+        top: 4rem;
+        right: 1rem;
+        z-index: 2000;
+    }
+    .profile-img {
+        width: 40px;
+        height: 40px;
+        border-radius: 50%;
+        cursor: pointer;
+        display: block;
+    }
+
+    .dropdown-content {
+        display: none;
+        position: absolute;
+        right: 0;
+        top: 45px;
+        background-color: #1F2324;
+        min-width: 200px;
+        box-shadow: 0px 4px 12px rgba(0,0,0,0.15);
+        padding: 16px;
+        border-radius: 8px;
+        font-size: 14px;
+        border: 1px solid #e0e0e0;
+    }
+    .profile-dropdown:hover .dropdown-content {
+        display: block;
+    }
+    .dropdown-content::before {
+        content: '';
+        position: absolute;
+        top: -1rem;
+        left: 0;
+        right: 0;
+        height: 1rem;
+        background: transparent;
+        pointer-events: auto;
+    }
+    .logout-button {
+        margin-top: 12px;
+        width: 100%;
+        background: #1a080e;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 5px;
+        cursor: pointer;
+        font-size: 13px;
+        font-family: inherit;
+    }
+    .logout-button:hover {
+        background: #153d4d;
+    }
+</style>
+"""
+
+
 def authenticate():
     """
     Handle authentication and display appropriate UI.
@@ -22,18 +81,31 @@ def authenticate():
     if st.user and st.user.get("email"):
         # User is logged in with valid data
 
-        # Add user to database if they don't exist
-        if not does_user_exist(st.user.get("email")):
-            to_add = {
-                "user_email": st.user.get("email"),
-                "budget": 1000,
-                # Use the consistent get_today() from config
-                "start_date": get_today().strftime("%Y-%m-%d"),
-                "investment_period": 12,
-                "boost_factor": 1.25,
-                "email_opted_in": 0,
-            }
-            add_user_info_to_sheet(to_add)
+        # Add user to database if they don't exist (checked once per session
+        # and email, since the answer only ever flips from missing to present)
+        user_email = st.user.get("email")
+        if st.session_state.get("_user_ensured") != user_email:
+            # Imported here so anonymous sessions never load the Supabase client
+            from dashboard.backend.supabase_utils import (
+                add_user_info_to_sheet,
+                does_user_exist,
+            )
+
+            user_ensured = does_user_exist(user_email)
+            if not user_ensured:
+                to_add = {
+                    "user_email": user_email,
+                    "budget": 1000,
+                    # Use the consistent get_today() from config
+                    "start_date": get_today().strftime("%Y-%m-%d"),
+                    "investment_period": 12,
+                    "boost_factor": 1.25,
+                    "email_opted_in": 0,
+                }
+                user_ensured = add_user_info_to_sheet(to_add) is not None
+            # Only remember success, so a failed lookup/insert retries next rerun
+            if user_ensured:
+                st.session_state["_user_ensured"] = user_email
 
         # Show welcome message in sidebar
         with st.sidebar:
@@ -46,68 +118,7 @@ def authenticate():
         provider = st.user.get("sub", "unknown|unknown").split("|")[0]
 
         # Inject CSS for profile dropdown
-        st.markdown(
-            """
-        <style>
-            .profile-dropdown {
-                position: fixed;
-                top: 4rem;
-                right: 1rem;
-                z-index: 2000;
-            }
-            .profile-img {
-                width: 40px;
-                height: 40px;
-                border-radius: 50%;
-                cursor: pointer;
-                display: block;
-            }
-            
-            .dropdown-content {
-                display: none;
-                position: absolute;
-                right: 0;
-                top: 45px;
-                background-color: #1F2324;
-                min-width: 200px;
-                box-shadow: 0px 4px 12px rgba(0,0,0,0.15);
-                padding: 16px;
-                border-radius: 8px;
-                font-size: 14px;
-                border: 1px solid #e0e0e0;
-            }
-            .profile-dropdown:hover .dropdown-content {
-                display: block;
-            }
-            .dropdown-content::before {
-                content: '';
-                position: absolute;
-                top: -1rem;
-                left: 0;
-                right: 0;
-                height: 1rem;
-                background: transparent;
-                pointer-events: auto;
-            }
-            .logout-button {
-                margin-top: 12px;
-                width: 100%;
-                background: #1a080e;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-size: 13px;
-                font-family: inherit;
-            }
-            .logout-button:hover {
-                background: #153d4d;
-            }
-        </style>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.html(_PROFILE_CSS)
 
         # Render profile dropdown
         # print(st.user.to_dict())
@@ -1,27 +1,136 @@
 # ui/charts.py
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from dashboard.model.strategy_new import construct_features
-import dashboard.config as config
-from datetime import datetime
 from dashboard.config import get_today
 
 
-def render_price_signals_chart(df_chart_display, weights, df_window, current_day):
+# Line traces are capped at this many points; the chart is narrower than that
+# in pixels, so extra points are only JSON payload and overdraw
+_MAX_LINE_POINTS = 800
+# Weight bars beyond this count are averaged into multi-day buckets
+_MAX_BARS = 400
+
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
     """
-    Renders the Price & Signals chart.
-    - current_day: The current day index (0-based) to slice data up to.
+    Largest-Triangle-Three-Buckets downsampling over evenly spaced points.
+
+    Args:
+        y: Values to downsample (x is taken as the integer position)
+        n_out: Number of points to keep, including both endpoints
+
+    Returns:
+        Sorted integer positions of the points to keep
     """
-    st.markdown("<h3>Bitcoin Price with Buy Signals</h3>", unsafe_allow_html=True)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
 
-    # Slice the window data up to the current day (inclusive, using 0-based index)
-    df_current_slice = df_window.iloc[: current_day + 1]
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
 
-    # Calculate features on the entire display range for continuous MA200 line
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Third triangle vertex: mean of the next bucket (or the last point)
+        if i == n_out - 3:
+            cx, cy = n - 1, y[-1]
+        else:
+            nhi = edges[i + 2]
+            cx, cy = (hi + nhi - 1) / 2, y[hi:nhi].mean()
+        bx = np.arange(lo, hi)
+        area = np.abs((a - cx) * (y[lo:hi] - y[a]) - (a - bx) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+
+    return idx
+
+
+def _f32(a) -> np.ndarray:
+    """Float32 copy of a trace array; Plotly ships it as a 4-byte typed array."""
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
+def _bucket_means(x: pd.Index, y: np.ndarray, max_points: int) -> tuple:
+    """
+    Average y over equal-width buckets so at most max_points remain.
+
+    Returns:
+        Tuple of (bucket start x values, bucket mean y values, bucket size)
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y, 1
+    bucket = -(-n // max_points)  # ceil division
+    starts = np.arange(0, n, bucket)
+    counts = np.diff(np.append(starts, n))
+    return x[starts], np.add.reduceat(y, starts) / counts, bucket
+
+
+def _downsample_line(series: pd.Series, log_scale: bool = False) -> tuple:
+    """Drop non-finite values and LTTB-reduce a line trace to (x, y) arrays."""
+    values = series.to_numpy(dtype=float)
+    finite = np.isfinite(values)
+    if log_scale:
+        finite &= values > 0
+    x = series.index[finite]
+    y = values[finite]
+    # Pick points on the axis scale they are drawn on
+    idx = _lttb_indices(np.log(y) if log_scale else y, _MAX_LINE_POINTS)
+    return x[idx], _f32(y[idx])
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_window_features(df_window: pd.DataFrame) -> pd.DataFrame:
+    """
+    construct_features for the accumulation window, memoized on its contents
+    so the Action Plan and the purchasing calendar share one computation.
+    The features are causal, so row i equals the features of df_window[: i + 1].
+    """
+    return construct_features(df_window)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_features(df_chart_display: pd.DataFrame) -> tuple:
+    """
+    construct_features memoized on the chart frame's contents.
+
+    Returns:
+        Tuple of (features, buy_mask, lines) where buy_mask is the
+        price < MA200 boolean array over the whole chart range and lines maps
+        "hist", "forecast" and "ma200" to downsampled (x, y) arrays
+    """
     features = construct_features(df_chart_display)
+    buy_mask = features["PriceUSD"].to_numpy() < features["ma200"].to_numpy()
+
+    type_col = df_chart_display["Type"]
+    lines = {
+        "hist": _downsample_line(
+            df_chart_display.loc[type_col == "Historical", "PriceUSD"], True
+        ),
+        "forecast": _downsample_line(
+            df_chart_display.loc[type_col == "Forecast", "PriceUSD"], True
+        ),
+        "ma200": _downsample_line(features["ma200"], True),
+    }
+    return features, buy_mask, lines
+
 
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _build_price_fig_skeleton(today, window_start, n_window):
+    """
+    Static part of the Price & Signals figure: subplot grid, reference lines,
+    annotations and layout. Shared across runs, so callers must copy it
+    before adding traces.
+    """
+    # The grid has no traces yet, so every reference line names its subplot
+    # and passes exclude_empty_subplots=False, or Plotly would drop it
     fig = make_subplots(
         rows=2,
         cols=1,
@@ -31,57 +140,22 @@ def render_price_signals_chart(df_chart_display, weights, df_window, current_day
         subplot_titles=("Price & MA200", "Daily Weights"),
     )
 
-    # --- Plot main price and MA200 lines ---
-    hist_data = df_chart_display[df_chart_display["Type"] == "Historical"]
-    forecast_data = df_chart_display[df_chart_display["Type"] == "Forecast"]
-
-    fig.add_trace(
-        go.Scatter(
-            x=hist_data.index,
-            y=hist_data["PriceUSD"],
-            name="Historical Price",
-            line=dict(color="#f7931a", width=2.5),
-        ),
-        row=1,
-        col=1,
-    )
-
-    if not forecast_data.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=forecast_data.index,
-                y=forecast_data["PriceUSD"],
-                name="Forecasted Price",
-                line=dict(color="#f7931a", width=2.5, dash="dash"),
-            ),
-            row=1,
-            col=1,
-        )
-
-    fig.add_trace(
-        go.Scatter(
-            x=features.index,
-            y=features["ma200"],
-            name="MA200",
-            line=dict(color="#667eea", width=2, dash="dash"),
-        ),
-        row=1,
-        col=1,
-    )
-
     fig.add_vline(
-        x=get_today(),
+        x=today,
         line_width=2,
         line_dash="dot",
         line_color="grey",
+        row=1,
+        col=1,
+        exclude_empty_subplots=False,
     )
 
     fig.add_annotation(
-        x=get_today(),
+        x=today,
         y=0.4,  # 1 = top of plotting area when yref='paper'
         xref="x",
         yref="paper",
-        text=f"Today ({get_today().date()})",
+        text=f"Today ({today.date()})",
         showarrow=False,
         xanchor="left",  # similar to "top left" placement
         yanchor="auto",
@@ -93,14 +167,17 @@ def render_price_signals_chart(df_chart_display, weights, df_window, current_day
     # --- Add Reference V-Lines ---
 
     fig.add_vline(
-        x=df_window.index[0],
+        x=window_start,
         line_width=2,
         line_dash="dot",
         line_color="grey",
+        row=1,
+        col=1,
+        exclude_empty_subplots=False,
     )
 
     fig.add_annotation(
-        x=df_window.index[0],
+        x=window_start,
         y=0.4,  # 1 = top of plotting area when yref='paper'
         xref="x",
         yref="paper",
@@ -113,46 +190,144 @@ def render_price_signals_chart(df_chart_display, weights, df_window, current_day
         font=dict(size=11),
     )
 
+    # Add reference line for uniform DCA
+    fig.add_hline(
+        y=1 / n_window,
+        line_dash="dash",
+        line_color="orange",
+        annotation_text="Uniform DCA",
+        row=2,
+        col=1,
+        exclude_empty_subplots=False,
+    )
+
+    fig.update_layout(
+        height=700,
+        # "closest" skips the per-move cross-trace merge that "x unified" does;
+        # the spike line below keeps the shared vertical cursor
+        hovermode="closest",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        # Same revision across day steps lets Plotly.react keep zoom/pan and
+        # patch traces; a new window start resets the view
+        uirevision=str(window_start.date()),
+    )
+    fig.update_yaxes(title_text="Price (USD)", type="log", row=1, col=1)
+    fig.update_yaxes(title_text="Weight", row=2, col=1)
+    fig.update_xaxes(
+        showspikes=True, spikemode="across", spikesnap="cursor", spikethickness=1
+    )
+    return fig
+
+
+def render_price_signals_chart(df_chart_display, weights, df_window, current_day):
+    """
+    Renders the Price & Signals chart.
+    - current_day: The current day index (0-based) to slice data up to.
+    """
+    st.markdown("<h3>Bitcoin Price with Buy Signals</h3>", unsafe_allow_html=True)
+
+    # Slice the window data up to the current day (inclusive, using 0-based index)
+    df_current_slice = df_window.iloc[: current_day + 1]
+
+    # Calculate features on the entire display range for continuous MA200 line
+    features, buy_mask, lines = _cached_features(df_chart_display)
+
+    # go.Figure() deep-copies the cached skeleton; only traces are added per run
+    fig = go.Figure(
+        _build_price_fig_skeleton(get_today(), df_window.index[0], len(df_window))
+    )
+
+    # --- Plot main price and MA200 lines (downsampled, see _downsample_line) ---
+    hist_x, hist_y = lines["hist"]
+    forecast_x, forecast_y = lines["forecast"]
+    ma_x, ma_y = lines["ma200"]
+
+    fig.add_trace(
+        go.Scattergl(
+            x=hist_x,
+            y=hist_y,
+            name="Historical Price",
+            line=dict(color="#f7931a", width=2.5),
+        ),
+        row=1,
+        col=1,
+    )
+
+    if len(forecast_x):
+        fig.add_trace(
+            go.Scattergl(
+                x=forecast_x,
+                y=forecast_y,
+                name="Forecasted Price",
+                line=dict(color="#f7931a", width=2.5, dash="dash"),
+            ),
+            row=1,
+            col=1,
+        )
+
+    fig.add_trace(
+        go.Scattergl(
+            x=ma_x,
+            y=ma_y,
+            name="MA200",
+            line=dict(color="#667eea", width=2, dash="dash"),
+        ),
+        row=1,
+        col=1,
+    )
+
     # --- Plot Buy Signals ---
     # Find all potential buy signals in the active window slice
-    features_slice = features.loc[df_current_slice.index]
-    buy_condition = features_slice["PriceUSD"] < features_slice["ma200"]
+    # The window is a contiguous daily run inside the chart range, so its
+    # rows map to a positional slice of the precomputed mask
+    i0 = features.index.get_loc(df_current_slice.index[0])
+    i1 = features.index.get_loc(df_current_slice.index[-1]) + 1
+    features_slice = features.iloc[i0:i1]
+    buy_condition = buy_mask[i0:i1]
+
+    # weights shares df_window's index, so the current slice is a prefix
+    w_all = weights.to_numpy()
+    w_slice = w_all[: len(df_current_slice)]
 
     if buy_condition.any():
         signal_dates = features_slice.index[buy_condition]
-        signal_prices = features_slice.loc[buy_condition, "PriceUSD"]
-        signal_weights = weights.loc[signal_dates]
+        signal_prices = features_slice["PriceUSD"].to_numpy()[buy_condition]
+        signal_weights = w_slice[buy_condition]
 
         # Use weights to determine marker size for visual emphasis
-        min_w, max_w = weights.min(), weights.max()
-        normalized_size = 15 + ((signal_weights - min_w) / (max_w - min_w + 1e-9)) * 25
+        min_w, max_w = w_all.min(), w_all.max()
+        normalized_size = 15.0 + (signal_weights - min_w) * (
+            25.0 / (max_w - min_w + 1e-9)
+        )
 
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=signal_dates,
-                y=signal_prices,
+                y=_f32(signal_prices),
                 mode="markers",
                 name="Buy Signal",
                 marker=dict(
-                    size=normalized_size,
+                    size=_f32(normalized_size),
                     color="red",
                     opacity=0.4,
                     line=dict(width=1, color="darkred"),
                 ),
                 hovertemplate="<b>Buy Signal</b><br>Price: $%{y:,.2f}<br>Weight: %{customdata:.5f}<extra></extra>",
-                customdata=signal_weights,
+                customdata=_f32(signal_weights),
             ),
             row=1,
             col=1,
         )
 
     # --- Plot Weights Bar Chart ---
-    weights_slice = weights.loc[df_current_slice.index]
+    # Long windows are shown as multi-day average bars (still per-day scale,
+    # so the uniform DCA line stays comparable)
+    bar_x, bar_y, bucket = _bucket_means(df_current_slice.index, w_slice, _MAX_BARS)
     fig.add_trace(
         go.Bar(
-            x=weights_slice.index,
-            y=weights_slice,
-            name="Daily Weight",
+            x=bar_x,
+            y=_f32(bar_y),
+            name="Daily Weight" if bucket == 1 else f"Daily Weight ({bucket}-day avg)",
             marker_color="#667eea",
             hovertemplate="Weight: %{y:.6f}<extra></extra>",
         ),
@@ -160,28 +335,9 @@ def render_price_signals_chart(df_chart_display, weights, df_window, current_day
         col=1,
     )
 
-    # Add reference line for uniform DCA
-    fig.add_hline(
-        y=1 / len(df_window),
-        line_dash="dash",
-        line_color="orange",
-        annotation_text="Uniform DCA",
-        row=2,
-        col=1,
-    )
-
-    fig.update_layout(
-        height=700,
-        hovermode="x unified",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
-    fig.update_yaxes(title_text="Price (USD)", type="log", row=1, col=1)
-    fig.update_yaxes(title_text="Weight", row=2, col=1)
-    st.plotly_chart(fig, config={"displayModeBar": True})
+    st.plotly_chart(fig, config={"displayModeBar": True}, key="price_signals_chart")
 
 
-# The other chart functions are okay and are omitted for brevity.
-# ... (render_weight_distribution_chart, etc. remain here) ...
 def render_weight_distribution_chart(weights, df_current):
     """Renders the Weight Distribution content for Tab 2."""
     st.markdown("### Daily Weight Distribution")
@@ -255,19 +411,27 @@ def render_bayesian_learning_chart():
 def render_strategy_comparison_chart(dynamic_perf, uniform_perf):
     """Renders the Strategy Comparison chart for Tab 4."""
     st.markdown("### Strategy Performance Comparison")
+    # Both SPD curves are LTTB-reduced to at most _MAX_LINE_POINTS points
+    dyn_x, dyn_y = _downsample_line(
+        dynamic_perf["Cumulative_SPD"].set_axis(dynamic_perf["Date"])
+    )
+    uni_x, uni_y = _downsample_line(
+        uniform_perf["Cumulative_SPD"].set_axis(uniform_perf["Date"])
+    )
+
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=dynamic_perf["Date"],
-            y=dynamic_perf["Cumulative_SPD"],
+            x=dyn_x,
+            y=dyn_y,
             name="Dynamic Strategy",
             line=dict(color="#667eea", width=3),
         )
     )
     fig.add_trace(
         go.Scatter(
-            x=uniform_perf["Date"],
-            y=uniform_perf["Cumulative_SPD"],
+            x=uni_x,
+            y=uni_y,
             name="Uniform DCA",
             line=dict(color="#f7931a", width=3, dash="dash"),
         )
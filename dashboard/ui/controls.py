@@ -1,9 +1,101 @@
 # dashboard/ui/controls.py
 import streamlit as st
+import numpy as np
 import pandas as pd
 import dashboard.config as config
-from datetime import datetime
-from dashboard.config import get_today
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_window(_df_btc, data_key, start_ts, end_ts):
+    """
+    Extract the accumulation window from df_btc, extended with placeholder
+    future rows at the last known price when end_ts is past the data.
+    Cached so slider/button reruns with an unchanged window skip the rebuild.
+
+    Args:
+        _df_btc: Full price frame (not hashed, see _data_key)
+        data_key: Cheap fingerprint of _df_btc used as the cache key
+
+    Returns:
+        Tuple of (df_window, last_historical_date)
+    """
+    df_btc = _df_btc
+
+    # Get historical data up to the end date (or last available if end_ts is in future)
+    # (mask the index directly rather than filtering the whole frame)
+    last_historical_date = df_btc.index[
+        df_btc["Type"].to_numpy() == "Historical"
+    ].max()
+
+    # Determine the actual start for historical data
+    # If start_ts is in the future, we'll start from the last historical date
+    historical_start = max(start_ts, df_btc.index[0])
+    historical_end = min(end_ts, last_historical_date)
+
+    # Extract historical data that overlaps with our window. The index is
+    # sorted, so the label range maps to positions by binary search; no copy
+    # is needed since callers only read the window (cache hits are copies)
+    if historical_start <= last_historical_date:
+        i0 = df_btc.index.searchsorted(historical_start, side="left")
+        i1 = df_btc.index.searchsorted(historical_end, side="right")
+        df_window = df_btc.iloc[i0:i1]
+    else:
+        # Entire window is in the future - create empty DataFrame with correct structure
+        df_window = pd.DataFrame(columns=["PriceUSD", "Type"])
+        df_window.index.name = "time"
+
+    # --- Add Future Dates if Needed ---
+    if end_ts > last_historical_date:
+        # Future data starts at the window start or the day after the data ends
+        future_start = max(start_ts, last_historical_date + pd.Timedelta(days=1))
+
+        # Create future date range straight from int64 nanoseconds (one day apart)
+        n_future = (end_ts - future_start).days + 1
+        future_dates = pd.DatetimeIndex(
+            future_start.value + np.arange(n_future, dtype=np.int64) * 86_400_000_000_000
+        )
+
+        # Get last known price for future projections
+        last_price = df_btc["PriceUSD"].to_numpy()[-1]
+
+        # Fill historical and placeholder future rows into preallocated
+        # arrays and build the window once, instead of concatenating frames
+        n_hist = len(df_window)
+        total_len = n_hist + len(future_dates)
+        prices = np.empty(total_len, dtype=np.float64)
+        prices[:n_hist] = df_window["PriceUSD"].to_numpy(dtype=np.float64)
+        prices[n_hist:] = last_price
+        types = np.empty(total_len, dtype=object)
+        types[:n_hist] = df_window["Type"].to_numpy()
+        types[n_hist:] = "Future"
+
+        df_window = pd.DataFrame(
+            {"PriceUSD": prices, "Type": types},
+            index=df_window.index.append(future_dates) if n_hist else future_dates,
+        )
+
+    return df_window, last_historical_date
+
+
+def _data_key(df_btc, last_price):
+    """
+    Fingerprint of the loaded price data: its date span, row count and latest
+    price. load_bitcoin_data only ever appends days or refreshes today's price,
+    each of which changes the key, so hashing every row isn't needed.
+    """
+    return (df_btc.index[0], df_btc.index[-1], len(df_btc), last_price)
+
+
+def _set_current_day(day):
+    """Button callback: jump to a day index."""
+    st.session_state.current_day = day
+
+
+def _step_current_day(delta, max_day):
+    """Button callback: move current_day by delta, kept within [0, max_day]."""
+    st.session_state.current_day = min(
+        max_day, max(0, st.session_state.get("current_day", 0) + delta)
+    )
 
 
 def render_controls(df_btc, investment_window):
@@ -11,17 +103,19 @@ def render_controls(df_btc, investment_window):
     Renders date selection and time control panel.
     Returns start_date (Timestamp), current_day (0-based int), and df_window.
     """
+    today = config.get_today()
+
     st.markdown("### 📅 Accumulation Period")
 
     # --- Date Selection ---
-    min_start_date = df_btc.index.min().date()
+    min_start_date = df_btc.index[0].date()  # index is sorted
     # Allow selecting dates well into the future
-    max_start_date = (get_today()).date()
+    max_start_date = today.date()
 
     # Set a default start date from user info or today
-    default_start = config.get_today()
+    default_start = today
     if st.session_state.get("user_info") and "start_date" in st.session_state.user_info:
-        default_start = pd.to_datetime(st.session_state.user_info["start_date"])
+        default_start = pd.Timestamp(st.session_state.user_info["start_date"])
 
     # Create all columns for date inputs and buttons first
     widths = [2, 2, 1, 1, 1, 1, 1]
@@ -55,34 +149,19 @@ def render_controls(df_btc, investment_window):
     col_idx += 1
 
     # --- DataFrame Window Extraction ---
-    # Get historical data up to the end date (or last available if end_ts is in future)
-    last_historical_date = df_btc[df_btc["Type"] == "Historical"].index.max()
-
-    # Determine the actual start for historical data
-    # If start_ts is in the future, we'll start from the last historical date
-    historical_start = max(start_ts, df_btc.index.min())
-    historical_end = min(end_ts, last_historical_date)
-
-    # Extract historical data that overlaps with our window
-    if historical_start <= last_historical_date:
-        df_window = df_btc.loc[historical_start:historical_end].copy()
-    else:
-        # Entire window is in the future - create empty DataFrame with correct structure
-        df_window = pd.DataFrame(columns=["PriceUSD", "Type"])
-        df_window.index.name = "time"
-
-    # --- Add Future Dates if Needed ---
-    # Calculate if we need future data
-    future_needed = end_ts > last_historical_date
+    # Latest price, read once for the cache key and the future-window notice
+    last_price = df_btc["PriceUSD"].to_numpy()[-1]
+    df_window, last_historical_date = _build_window(
+        df_btc, _data_key(df_btc, last_price), start_ts, end_ts
+    )
 
-    if future_needed:
-        # Determine where future data should start
+    # --- Explain Future Dates if Needed ---
+    if end_ts > last_historical_date:
         if start_ts > last_historical_date:
             # Entire window is in the future
-            future_start = start_ts
             st.info(
                 f"ℹ️ The selected investment period is entirely in the future. "
-                f"Using last known BTC price (${df_btc['PriceUSD'].iloc[-1]:,.2f}) "
+                f"Using last known BTC price (${last_price:,.2f}) "
                 f"for DCA schedule planning."
             )
         else:
@@ -94,70 +173,48 @@ def render_controls(df_btc, investment_window):
                 f"Budget will be allocated across the entire {investment_window}-month period."
             )
 
-        # Create future date range
-        future_dates = pd.date_range(start=future_start, end=end_ts, freq="D")
-
-        # Get last known price for future projections
-        last_price = df_btc["PriceUSD"].iloc[-1]
-
-        # Create placeholder future data
-        future_df = pd.DataFrame(
-            {
-                "PriceUSD": [last_price] * len(future_dates),
-                "Type": ["Future"] * len(future_dates),
-            },
-            index=future_dates,
-        )
-
-        # Append future data to df_window
-        df_window = pd.concat([df_window, future_df])
-
     # Final validation - ensure we have some data
-    if len(df_window) < 1:
+    n_window = len(df_window)
+    if n_window < 1:
         st.error(
             "⚠️ Unable to create investment window. Please try a different date range."
         )
         st.stop()
+    max_day_index = n_window - 1
+    last_day_ts = df_window.index[-1]
 
     # Check if today is in the window
-    today_is_in_window = start_ts <= config.get_today() <= end_ts
+    today_is_in_window = start_ts <= today <= end_ts
     today_day_index = None
 
     if today_is_in_window:
-        try:
-            # Use get_loc for a robust way to find the integer position of get_today()
-            today_day_index = df_window.index.get_loc(config.get_today())
-        except KeyError:
-            # get_today() might not be in the index - find closest date
-            if config.get_today() <= df_window.index[-1]:
-                # Find closest date to today that's in our window
-                valid_dates = df_window.index[df_window.index <= config.get_today()]
-                if len(valid_dates) > 0:
-                    closest_date = valid_dates[-1]
-                    today_day_index = df_window.index.get_loc(closest_date)
-                else:
-                    today_is_in_window = False
+        # Position of today, or of the closest date before it if today is
+        # missing from the index; one binary search covers both cases
+        pos = df_window.index.searchsorted(today, side="right") - 1
+        if pos < 0:
+            today_is_in_window = False
+        elif today <= last_day_ts:
+            today_day_index = int(pos)
 
     # Reset simulation if the date window changes
     if (
-        st.session_state.get("last_start_date") != start_ts
+        st.session_state.get("last_start_date_ns") != start_ts.value
         or st.session_state.get("last_investment_window") != investment_window
     ):
         st.session_state.current_day = (
             today_day_index if today_day_index is not None else 0
         )
-        st.session_state.last_start_date = start_ts
+        # Stored as int64 nanoseconds so the per-rerun check is an int compare
+        st.session_state.last_start_date_ns = start_ts.value
         st.session_state.last_investment_window = investment_window
         st.session_state.bayesian_history = []  # Reset learning on new window
 
     # --- Time Control Buttons (using 0-based index) ---
-    max_day_index = len(df_window) - 1
-
     # Determine the max value for the slider to prevent going into the future
     slider_max_day = max_day_index
     if today_is_in_window and today_day_index is not None:
         slider_max_day = today_day_index
-    elif start_ts > config.get_today():  # If the whole window is in the future
+    elif start_ts > today:  # If the whole window is in the future
         slider_max_day = (
             max_day_index  # Allow viewing entire future window for planning
         )
@@ -167,39 +224,51 @@ def render_controls(df_btc, investment_window):
         st.session_state.get("current_day", 0), slider_max_day
     )
 
-    current_day = st.session_state.current_day
-
+    # Navigation buttons update current_day in on_click callbacks, which run
+    # before the script, so a click costs a single run
     # First Button
-    if cols[col_idx].button("⏮️ First", use_container_width=True):
-        st.session_state.current_day = 0
-        st.rerun()
+    cols[col_idx].button(
+        "⏮️ First", on_click=_set_current_day, args=(0,), use_container_width=True
+    )
     col_idx += 1
 
     # Prev Button
-    if cols[col_idx].button("◀️ Prev", use_container_width=True):
-        st.session_state.current_day = max(0, st.session_state.current_day - 1)
-        st.rerun()
+    cols[col_idx].button(
+        "◀️ Prev",
+        on_click=_step_current_day,
+        args=(-1, slider_max_day),
+        use_container_width=True,
+    )
     col_idx += 1
 
     # Next Button - Use slider_max_day to cap navigation
-    if cols[col_idx].button("▶️ Next", use_container_width=True):
-        st.session_state.current_day = min(
-            slider_max_day, st.session_state.current_day + 1
-        )
-        st.rerun()
+    cols[col_idx].button(
+        "▶️ Next",
+        on_click=_step_current_day,
+        args=(1, slider_max_day),
+        use_container_width=True,
+    )
     col_idx += 1
 
     # Last Button - Use slider_max_day to cap navigation
-    if cols[col_idx].button("⏭️ Last", use_container_width=True):
-        st.session_state.current_day = slider_max_day
-        st.rerun()
+    cols[col_idx].button(
+        "⏭️ Last",
+        on_click=_set_current_day,
+        args=(slider_max_day,),
+        use_container_width=True,
+    )
     col_idx += 1
 
     # Today Button (conditional)
     if today_is_in_window and today_day_index is not None:
-        if cols[col_idx].button("📅 Today", use_container_width=True):
-            st.session_state.current_day = today_day_index
-            st.rerun()
+        cols[col_idx].button(
+            "📅 Today",
+            on_click=_set_current_day,
+            args=(today_day_index,),
+            use_container_width=True,
+        )
+
+    current_day = st.session_state.current_day
 
     if slider_max_day != 0:
         st.slider(
@@ -2,24 +2,42 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import calendar as cal_module
+import plotly.graph_objects as go
 from dashboard.ui.charts import (
     render_price_signals_chart,
     render_weight_distribution_chart,
     render_bayesian_learning_chart,
     render_strategy_comparison_chart,
+    get_window_features,
 )
 
 from dashboard.config import get_today
 
-from dashboard.model.strategy_new import construct_features
 from dashboard.analytics.portfolio_metrics import PortfolioAnalyzer, compare_strategies
 from dashboard.analytics.accumulation_metrics import AccumulationAnalyzer
 
 # --- Helper Functions for Calculation and Styling ---
 
 
+def _last_values(perf, columns) -> dict:
+    """Final value of each requested column, as Python floats."""
+    return {col: float(perf[col].to_numpy()[-1]) for col in columns}
+
+
+def _pct_advantage(dynamic, uniform):
+    """
+    Percentage by which dynamic exceeds uniform, 0 where uniform is not
+    positive. Branchless, so it works on scalars and arrays alike.
+    """
+    dynamic = np.asarray(dynamic, dtype=np.float64)
+    uniform = np.asarray(uniform, dtype=np.float64)
+    out = np.zeros(np.broadcast(dynamic, uniform).shape)
+    np.divide(dynamic - uniform, uniform, out=out, where=uniform > 0)
+    out *= 100
+    return float(out) if out.ndim == 0 else out
+
+
 def _calculate_metrics(df_window, dynamic_perf, uniform_perf, current_day):
     """Calculates all key performance indicators and returns them in a dictionary."""
     metrics = {}
@@ -28,11 +46,15 @@ def _calculate_metrics(df_window, dynamic_perf, uniform_perf, current_day):
     if dynamic_perf.empty or uniform_perf.empty:
         return {}
 
-    last_day_dynamic = dynamic_perf.iloc[-1]
-    last_day_uniform = uniform_perf.iloc[-1]
+    # Read the final values straight from the column arrays; a row via
+    # .iloc[-1] would interleave every column of the mixed-dtype frame
+    last_day_dynamic = _last_values(
+        dynamic_perf, ("Portfolio_Value", "PnL", "PnL_Pct", "Total_BTC", "Cumulative_SPD")
+    )
+    last_day_uniform = _last_values(uniform_perf, ("Total_BTC", "Cumulative_SPD"))
 
     # Core metrics
-    metrics["current_price"] = df_window.iloc[current_day]["PriceUSD"]
+    metrics["current_price"] = float(df_window["PriceUSD"].to_numpy()[current_day])
     metrics["portfolio_value"] = last_day_dynamic["Portfolio_Value"]
     metrics["pnl"] = last_day_dynamic["PnL"]
     metrics["pnl_pct"] = last_day_dynamic["PnL_Pct"]
@@ -42,30 +64,39 @@ def _calculate_metrics(df_window, dynamic_perf, uniform_perf, current_day):
     metrics["uniform_spd"] = last_day_uniform["Cumulative_SPD"]
 
     # Comparison metrics
-    metrics["btc_advantage_pct"] = (
-        (metrics["dynamic_btc"] - metrics["uniform_btc"]) / metrics["uniform_btc"] * 100
-        if metrics["uniform_btc"] > 0
-        else 0
+    metrics["btc_advantage_pct"] = _pct_advantage(
+        metrics["dynamic_btc"], metrics["uniform_btc"]
     )
-    metrics["spd_advantage_pct"] = (
-        (metrics["dynamic_spd"] - metrics["uniform_spd"]) / metrics["uniform_spd"] * 100
-        if metrics["uniform_spd"] > 0
-        else 0
+    metrics["spd_advantage_pct"] = _pct_advantage(
+        metrics["dynamic_spd"], metrics["uniform_spd"]
     )
 
     return metrics
 
 
-def _get_signal_style(weight: float, avg_weight: float) -> dict:
-    """Returns a dictionary with style elements based on buy signal strength."""
-    if weight > avg_weight * 2:
-        return {"color": "green", "emoji": "🟢", "text": "Strong Buy"}
-    elif weight > avg_weight * 1.5:
-        return {"color": "#FFA500", "emoji": "🟠", "text": "Moderate Buy"}
-    elif weight > avg_weight:
-        return {"color": "#FFD700", "emoji": "🟡", "text": "Light Buy"}
-    else:
-        return {"color": "red", "emoji": "🔴", "text": "Reduced"}
+# Buy signal styles, strongest first; _signal_levels indexes into this
+_SIGNAL_STYLES = (
+    {"color": "green", "emoji": "🟢", "text": "Strong Buy"},
+    {"color": "#FFA500", "emoji": "🟠", "text": "Moderate Buy"},
+    {"color": "#FFD700", "emoji": "🟡", "text": "Light Buy"},
+    {"color": "red", "emoji": "🔴", "text": "Reduced"},
+)
+
+
+def _signal_levels(weights, avg_weight: float) -> np.ndarray:
+    """
+    Classify buy signal strength for a whole array of weights at once.
+
+    Returns:
+        Array of indices into _SIGNAL_STYLES (weight above 2x, 1.5x or 1x the
+        average weight, otherwise Reduced)
+    """
+    w = np.asarray(weights, dtype=np.float64)
+    return np.select(
+        [w > avg_weight * 2, w > avg_weight * 1.5, w > avg_weight],
+        [0, 1, 2],
+        default=3,
+    )
 
 
 # --- Main Rendering Functions ---
@@ -101,29 +132,123 @@ def render_main_metrics(metrics: dict):
 
 def render_comparison_summary(metrics: dict, dynamic_perf, uniform_perf):
     """Renders the summary tables for the strategy comparison tab."""
+    last_day_dynamic = dynamic_perf.iloc[-1]
+    last_day_uniform = uniform_perf.iloc[-1]
+
     st.markdown("#### Performance Breakdown")
     col1, col2 = st.columns(2)
 
+    # One markdown element per column: heading and figures together
+
     with col1:
-        st.markdown("**Dynamic Strategy**")
         st.markdown(
             f"""
+            **Dynamic Strategy**
+
             - **Total BTC:** `{metrics['dynamic_btc']:.8f} ₿`
-            - **Avg. Entry:** `${dynamic_perf.iloc[-1]['Avg_Entry_Price']:,.2f}`
+            - **Avg. Entry:** `${last_day_dynamic['Avg_Entry_Price']:,.2f}`
             - **P&L:** `${metrics['pnl']:,.2f} ({metrics['pnl_pct']:+.2f}%)`
             """
         )
     with col2:
-        st.markdown("**Uniform DCA**")
         st.markdown(
             f"""
+            **Uniform DCA**
+
             - **Total BTC:** `{metrics['uniform_btc']:.8f} ₿`
-            - **Avg. Entry:** `${uniform_perf.iloc[-1]['Avg_Entry_Price']:,.2f}`
-            - **P&L:** `${uniform_perf.iloc[-1]['PnL']:,.2f} ({uniform_perf.iloc[-1]['PnL_Pct']:+.2f}%)`
+            - **Avg. Entry:** `${last_day_uniform['Avg_Entry_Price']:,.2f}`
+            - **P&L:** `${last_day_uniform['PnL']:,.2f} ({last_day_uniform['PnL_Pct']:+.2f}%)`
             """
         )
 
 
+# Header tooltips for the Performance Metrics table
+_METRICS_TABLE_HELP = {
+    "Metric": "Key performance indicators for your Bitcoin investment strategy",
+    "Value": "Current values and holdings",
+    "Change / Comparison": "Performance comparison against uniform dollar-cost averaging (DCA) strategy. Positive percentages indicate the dynamic strategy is outperforming uniform DCA by accumulating more Bitcoin per dollar spent.",
+}
+
+
+def _metrics_table_html(metrics_data: dict) -> str:
+    """Render the metrics_data columns as a single HTML table string."""
+    header = "".join(
+        f'<th title="{_METRICS_TABLE_HELP.get(col, "")}">{col}</th>'
+        for col in metrics_data
+    )
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>"
+        for row in zip(*metrics_data.values())
+    )
+    return (
+        '<table style="width: 100%;">'
+        f"<thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table>"
+    )
+
+
+@st.fragment
+def _render_tabs(
+    df_window,
+    weights,
+    dynamic_perf,
+    uniform_perf,
+    current_day,
+    df_for_chart,
+    budget,
+    metrics,
+):
+    """
+    Tabbed visualizations of render_performance, isolated as a fragment so
+    switching tabs reruns only this block with the last full run's inputs.
+    """
+    # Only the selected tab's body is built; switching tabs reruns the
+    # fragment so the newly opened tab renders then
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        [
+            "📈 Price & Signals",
+            "📊 Strategy Comparison",
+            "💎 Performance Analytics",
+            "📅 Purchasing Schedule",
+            "🧠 Strategy Intelligence",
+        ],
+        key="performance_tabs",
+        on_change="rerun",
+    )
+
+    if tab1.open:
+        with tab1:
+            render_price_signals_chart(
+                df_chart_display=df_for_chart,
+                weights=weights,
+                df_window=df_window,
+                current_day=current_day,
+            )
+
+    if tab2.open:
+        with tab2:
+            st.markdown("### Cumulative Sats-per-Dollar (SPD) Comparison")
+            st.info(
+                "Higher SPD means you are accumulating more Bitcoin for every dollar spent."
+            )
+            render_strategy_comparison_chart(dynamic_perf, uniform_perf)
+            st.markdown("---")
+            render_comparison_summary(metrics, dynamic_perf, uniform_perf)
+
+    if tab3.open:
+        with tab3:
+            render_risk_metrics_tab(dynamic_perf, uniform_perf)
+
+    if tab4.open:
+        with tab4:
+            render_purchasing_calendar(
+                df_window, dynamic_perf, weights, current_day, total_budget=budget
+            )
+
+    if tab5.open:
+        with tab5:
+            render_strategy_intelligence_tab(dynamic_perf, uniform_perf, df_window)
+
+
 def render_performance(
     df_window,
     weights,
@@ -148,18 +273,13 @@ def render_performance(
         else:
             st.info(f"📊 **Using {model_choice}**")
 
-    current_price = df_window.iloc[current_day]["PriceUSD"]
-    dynamic_btc = dynamic_perf.iloc[-1]["Total_BTC"]
-    uniform_btc = uniform_perf.iloc[-1]["Total_BTC"]
-    btc_advantage = (
-        ((dynamic_btc - uniform_btc) / uniform_btc * 100) if uniform_btc > 0 else 0
-    )
-    dynamic_pnl_pct = dynamic_perf.iloc[-1]["PnL_Pct"]
-    dynamic_spd = dynamic_perf.iloc[-1]["Cumulative_SPD"]
-    uniform_spd = uniform_perf.iloc[-1]["Cumulative_SPD"]
-    spd_advantage = (
-        ((dynamic_spd - uniform_spd) / uniform_spd * 100) if uniform_spd > 0 else 0
-    )
+    # Everything below reads the values _calculate_metrics already extracted
+    current_price = metrics["current_price"]
+    dynamic_btc = metrics["dynamic_btc"]
+    btc_advantage = metrics["btc_advantage_pct"]
+    dynamic_pnl_pct = metrics["pnl_pct"]
+    dynamic_spd = metrics["dynamic_spd"]
+    spd_advantage = metrics["spd_advantage_pct"]
     current_date = df_window.index[current_day]
 
     # --- SPD Percentile Calculation ---
@@ -168,13 +288,14 @@ def render_performance(
         # Calculate theoretical best and worst SPD
         # Best case: buy all at the lowest price in the period
         # Worst case: buy all at the highest price in the period
-        prices = df_window.iloc[: current_day + 1]["PriceUSD"]
+        # (reduced on the raw price array, no Series slice)
+        prices = df_window["PriceUSD"].to_numpy()[: current_day + 1]
 
         best_spd = (1e8 / prices.min()) * (current_day + 1)  # All buys at lowest price
         worst_spd = (1e8 / prices.max()) * (
             current_day + 1
         )  # All buys at highest price
-        current_spd = historical_perf.iloc[-1]["Cumulative_SPD"]
+        current_spd = historical_perf["Cumulative_SPD"].to_numpy()[-1]
 
         # Avoid division by zero
         if (best_spd - worst_spd) == 0:
@@ -196,8 +317,8 @@ def render_performance(
         "Value": [
             f"${current_price:,.0f}",
             f"{dynamic_btc:.5f} ₿",
-            f"${dynamic_perf.iloc[-1]['Portfolio_Value']:,.2f}",
-            f"${dynamic_perf.iloc[-1]['PnL']:,.2f}",
+            f"${metrics['portfolio_value']:,.2f}",
+            f"${metrics['pnl']:,.2f}",
             f"{dynamic_spd:,.0f}",
             f"{spd_percentile:.1f}%",
         ],
@@ -211,69 +332,21 @@ def render_performance(
         ],
     }
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(
-        [
-            "📈 Price & Signals",
-            "📊 Strategy Comparison",
-            "💎 Performance Analytics",
-            "📅 Purchasing Schedule",
-            "🧠 Strategy Intelligence",
-        ]
+    _render_tabs(
+        df_window,
+        weights,
+        dynamic_perf,
+        uniform_perf,
+        current_day,
+        df_for_chart,
+        budget,
+        metrics,
     )
 
-    df_current = df_window.iloc[: current_day + 1]
-
-    with tab1:
-        render_price_signals_chart(
-            df_chart_display=df_for_chart,
-            weights=weights,
-            df_window=df_window,
-            current_day=current_day,
-        )
-
-    with tab2:
-        st.markdown("### Cumulative Sats-per-Dollar (SPD) Comparison")
-        st.info(
-            "Higher SPD means you are accumulating more Bitcoin for every dollar spent."
-        )
-        render_strategy_comparison_chart(dynamic_perf, uniform_perf)
-        st.markdown("---")
-        render_comparison_summary(metrics, dynamic_perf, uniform_perf)
-
-    with tab3:
-        render_risk_metrics_tab(dynamic_perf, uniform_perf)
-
-    with tab4:
-        render_purchasing_calendar(
-            df_window, dynamic_perf, weights, current_day, total_budget=budget
-        )
-
-    with tab5:
-        render_strategy_intelligence_tab(dynamic_perf, uniform_perf, df_window)
-
     st.markdown("<h3>Performance Metrics</h3>", unsafe_allow_html=True)
 
-    metrics_df = pd.DataFrame(metrics_data)
-    st.dataframe(
-        metrics_df,
-        hide_index=True,
-        column_config={
-            "Metric": st.column_config.TextColumn(
-                "Metric",
-                help="Key performance indicators for your Bitcoin investment strategy",
-                width="medium",
-            ),
-            "Value": st.column_config.TextColumn(
-                "Value", help="Current values and holdings", width="medium"
-            ),
-            "Change / Comparison": st.column_config.TextColumn(
-                "Change / Comparison",
-                help="Performance comparison against uniform dollar-cost averaging (DCA) strategy. Positive percentages indicate the dynamic strategy is outperforming uniform DCA by accumulating more Bitcoin per dollar spent.",
-                width="medium",
-            ),
-        },
-        width="stretch",
-    )
+    # Static six-row table: plain HTML, no Arrow serialization or grid widget
+    st.markdown(_metrics_table_html(metrics_data), unsafe_allow_html=True)
 
     # Add additional explanation for SPD
     with st.expander("ℹ️ What are SPD (Satoshis Per Dollar) and SPD Percentile?"):
@@ -290,23 +363,175 @@ def render_performance(
         )
 
 
+def _perf_key(perf):
+    """
+    Cheap fingerprint of a performance frame: its date span, length and final
+    P&L / portfolio value. Used as the cache key instead of hashing every row.
+    """
+    if perf.empty:
+        return (0,)
+    # The frames have a RangeIndex; the window's dates live in the Date column
+    dates = perf["Date"].to_numpy()
+    last = _last_values(perf, ("PnL", "Portfolio_Value"))
+    return (
+        dates[0],
+        dates[-1],
+        len(perf),
+        last["PnL"],
+        last["Portfolio_Value"],
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _risk_bundle(perf_key, _perf):
+    """
+    PortfolioAnalyzer metrics for one strategy, cached on perf_key so reruns
+    with the same performance frame skip the recomputation.
+
+    Returns:
+        Dict with sharpe, sortino, max_dd, dd_start, dd_end, win_rate,
+        vol (annualized, %), calmar and total_return (final PnL_Pct)
+    """
+    analyzer = PortfolioAnalyzer(_perf)
+    max_dd, dd_start, dd_end = analyzer.max_drawdown()
+    return {
+        "sharpe": analyzer.sharpe_ratio(),
+        "sortino": analyzer.sortino_ratio(),
+        "max_dd": max_dd,
+        "dd_start": dd_start,
+        "dd_end": dd_end,
+        "win_rate": analyzer.win_rate(),
+        "vol": analyzer.volatility() * 100,
+        "calmar": analyzer.calmar_ratio(),
+        "total_return": (
+            float(_perf["PnL_Pct"].to_numpy()[-1]) if not _perf.empty else 0.0
+        ),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_comparison(dynamic_key, uniform_key, _dynamic_perf, _uniform_perf):
+    """
+    compare_strategies, cached on the two frames' fingerprints, with the
+    drawdown rows turned into dates (see _drawdown_dates).
+    """
+    return _drawdown_dates(
+        compare_strategies(_dynamic_perf, _uniform_perf), _dynamic_perf, _uniform_perf
+    )
+
+
+_DRAWDOWN_ROWS = ["Drawdown Start", "Drawdown End"]
+
+
+def _drawdown_dates(comparison, dynamic_perf, uniform_perf):
+    """
+    Replace the Drawdown Start/End row positions with each strategy's Date.
+
+    The performance frames have a RangeIndex, so PortfolioAnalyzer reports
+    the drawdown bounds as row positions. Difference becomes the Timedelta
+    between the two strategies' dates.
+    """
+    comparison = comparison.astype(object)
+    for col, perf in (("Dynamic Strategy", dynamic_perf), ("Uniform DCA", uniform_perf)):
+        dates = perf["Date"]
+        for row in _DRAWDOWN_ROWS:
+            value = comparison.at[row, col]
+            if not isinstance(value, pd.Timestamp) and len(dates):
+                comparison.at[row, col] = dates.iloc[int(value)]
+    for row in _DRAWDOWN_ROWS:
+        comparison.at[row, "Difference"] = (
+            comparison.at[row, "Dynamic Strategy"] - comparison.at[row, "Uniform DCA"]
+        )
+    return comparison
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _risk_return_fig(dynamic_vol, dynamic_ret, uniform_vol, uniform_ret):
+    """
+    Risk-return scatter for the two strategies. Built from four scalars, so
+    it is cached as a shared resource and reused while they are unchanged.
+    """
+    fig = go.Figure()
+
+    # Add quadrant backgrounds
+    avg_vol = (dynamic_vol + uniform_vol) / 2
+    avg_ret = (dynamic_ret + uniform_ret) / 2
+
+    # Add shaded regions
+    fig.add_shape(type="rect", x0=0, y0=avg_ret, x1=avg_vol, y1=max(dynamic_ret, uniform_ret) * 1.2,
+                  fillcolor="lightgreen", opacity=0.1, line_width=0)
+    fig.add_annotation(x=avg_vol*0.5, y=max(dynamic_ret, uniform_ret) * 1.1,
+                      text="🎯 Ideal Zone<br>(High Return, Low Risk)", showarrow=False,
+                      font=dict(size=10, color="green"))
+
+    # Plot strategies
+    fig.add_trace(
+        go.Scatter(
+            x=[dynamic_vol],
+            y=[dynamic_ret],
+            mode="markers+text",
+            name="Dynamic Strategy",
+            marker=dict(size=25, color="#667eea", line=dict(width=2, color="white")),
+            text=["Dynamic"],
+            textposition="top center",
+            textfont=dict(size=12, color="#667eea", family="Arial Black"),
+            hovertemplate="<b>Dynamic Strategy</b><br>Volatility: %{x:.2f}%<br>Return: %{y:.2f}%<extra></extra>",
+        )
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=[uniform_vol],
+            y=[uniform_ret],
+            mode="markers+text",
+            name="Uniform DCA",
+            marker=dict(size=25, color="#f7931a", line=dict(width=2, color="white")),
+            text=["Uniform DCA"],
+            textposition="bottom center",
+            textfont=dict(size=12, color="#f7931a", family="Arial Black"),
+            hovertemplate="<b>Uniform DCA</b><br>Volatility: %{x:.2f}%<br>Return: %{y:.2f}%<extra></extra>",
+        )
+    )
+
+    fig.update_layout(
+        height=450,
+        xaxis_title="Annualized Volatility (%)",
+        yaxis_title="Total Return (%)",
+        showlegend=False,
+        hovermode="closest",
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+    )
+
+    return fig
+
+
+def _format_date_cell(value):
+    """Display format for the drawdown date rows (dates and their difference)."""
+    if isinstance(value, pd.Timestamp):
+        return f"{value:%Y-%m-%d}"
+    if isinstance(value, pd.Timedelta):
+        return f"{value.days:+d} days"
+    return str(value)
+
+
 def render_risk_metrics_tab(dynamic_perf, uniform_perf):
     """Render Performance Analytics Tab with institutional-grade metrics"""
     st.markdown("## 💎 Performance Analytics")
     st.markdown("*Institutional-grade metrics demonstrating strategy quality and consistency*")
     st.markdown("---")
 
-    analyzer_dynamic = PortfolioAnalyzer(dynamic_perf)
-    analyzer_uniform = PortfolioAnalyzer(uniform_perf)
+    dynamic_key = _perf_key(dynamic_perf)
+    uniform_key = _perf_key(uniform_perf)
+    risk_dynamic = _risk_bundle(dynamic_key, dynamic_perf)
+    risk_uniform = _risk_bundle(uniform_key, uniform_perf)
 
     # Calculate all metrics
-    sharpe = analyzer_dynamic.sharpe_ratio()
-    sortino = analyzer_dynamic.sortino_ratio()
-    max_dd, dd_start, dd_end = analyzer_dynamic.max_drawdown()
-    win_rate = analyzer_dynamic.win_rate()
-    volatility = analyzer_dynamic.volatility() * 100
-    calmar = analyzer_dynamic.calmar_ratio()
-    total_return = dynamic_perf.iloc[-1]["PnL_Pct"] if not dynamic_perf.empty else 0
+    sharpe = risk_dynamic["sharpe"]
+    sortino = risk_dynamic["sortino"]
+    max_dd = risk_dynamic["max_dd"]
+    win_rate = risk_dynamic["win_rate"]
+    total_return = risk_dynamic["total_return"]
 
     # Calculate performance grade
     def get_performance_grade(sharpe, sortino, win_rate):
@@ -407,10 +632,17 @@ def render_risk_metrics_tab(dynamic_perf, uniform_perf):
     # Section 3: Detailed Comparison
     st.markdown("### 📋 Strategy Performance Comparison")
 
-    comparison_df = compare_strategies(dynamic_perf, uniform_perf)
+    comparison_df = _cached_comparison(
+        dynamic_key, uniform_key, dynamic_perf, uniform_perf
+    )
 
-    # Format the comparison table nicely
-    st.dataframe(comparison_df.style.format("{:.2f}", na_rep=""), width="stretch")
+    # Format the comparison table nicely: one formatter per row group rather
+    # than per cell, keeping the drawdown dates out of the numeric format
+    date_rows = comparison_df.index.isin(_DRAWDOWN_ROWS)
+    styled = comparison_df.style.format(
+        "{:.2f}", subset=pd.IndexSlice[~date_rows, :], na_rep=""
+    ).format(_format_date_cell, subset=pd.IndexSlice[date_rows, :], na_rep="")
+    st.dataframe(styled, width="stretch")
 
     st.markdown("---")
 
@@ -418,63 +650,13 @@ def render_risk_metrics_tab(dynamic_perf, uniform_perf):
     st.markdown("### 📈 Risk-Return Efficiency Map")
     st.info("Higher return with lower volatility indicates superior risk-adjusted performance")
 
-    import plotly.graph_objects as go
-
-    dynamic_vol = analyzer_dynamic.volatility() * 100
+    dynamic_vol = risk_dynamic["vol"]
     dynamic_ret = total_return
-    uniform_vol = analyzer_uniform.volatility() * 100
-    uniform_ret = uniform_perf.iloc[-1]["PnL_Pct"] if not uniform_perf.empty else 0
-
-    fig = go.Figure()
-
-    # Add quadrant backgrounds
-    avg_vol = (dynamic_vol + uniform_vol) / 2
-    avg_ret = (dynamic_ret + uniform_ret) / 2
+    uniform_vol = risk_uniform["vol"]
+    uniform_ret = risk_uniform["total_return"]
 
-    # Add shaded regions
-    fig.add_shape(type="rect", x0=0, y0=avg_ret, x1=avg_vol, y1=max(dynamic_ret, uniform_ret) * 1.2,
-                  fillcolor="lightgreen", opacity=0.1, line_width=0)
-    fig.add_annotation(x=avg_vol*0.5, y=max(dynamic_ret, uniform_ret) * 1.1,
-                      text="🎯 Ideal Zone<br>(High Return, Low Risk)", showarrow=False,
-                      font=dict(size=10, color="green"))
-
-    # Plot strategies
-    fig.add_trace(
-        go.Scatter(
-            x=[dynamic_vol],
-            y=[dynamic_ret],
-            mode="markers+text",
-            name="Dynamic Strategy",
-            marker=dict(size=25, color="#667eea", line=dict(width=2, color="white")),
-            text=["Dynamic"],
-            textposition="top center",
-            textfont=dict(size=12, color="#667eea", family="Arial Black"),
-            hovertemplate="<b>Dynamic Strategy</b><br>Volatility: %{x:.2f}%<br>Return: %{y:.2f}%<extra></extra>",
-        )
-    )
-
-    fig.add_trace(
-        go.Scatter(
-            x=[uniform_vol],
-            y=[uniform_ret],
-            mode="markers+text",
-            name="Uniform DCA",
-            marker=dict(size=25, color="#f7931a", line=dict(width=2, color="white")),
-            text=["Uniform DCA"],
-            textposition="bottom center",
-            textfont=dict(size=12, color="#f7931a", family="Arial Black"),
-            hovertemplate="<b>Uniform DCA</b><br>Volatility: %{x:.2f}%<br>Return: %{y:.2f}%<extra></extra>",
-        )
-    )
-
-    fig.update_layout(
-        height=450,
-        xaxis_title="Annualized Volatility (%)",
-        yaxis_title="Total Return (%)",
-        showlegend=False,
-        hovermode="closest",
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
+    fig = _risk_return_fig(
+        float(dynamic_vol), float(dynamic_ret), float(uniform_vol), float(uniform_ret)
     )
 
     st.plotly_chart(fig, config={"displayModeBar": True}, width="stretch")
@@ -526,6 +708,70 @@ def render_risk_metrics_tab(dynamic_perf, uniform_perf):
         )
 
 
+# Month grid layout and hover reveal for planned amounts, injected once per
+# calendar render and shared by every month's grid
+_CALENDAR_STYLE = (
+    "<style>"
+    ".cal-grid { display: grid; grid-template-columns: repeat(7, 1fr); gap: 4px; }"
+    ".dca-amount .hidden-amount { opacity: 0; transition: opacity 0.2s ease; }"
+    ".dca-amount .placeholder { opacity: 1; transition: opacity 0.2s ease; }"
+    ".dca-amount:hover .hidden-amount { opacity: 1; }"
+    ".dca-amount:hover .placeholder { opacity: 0; }"
+    "</style>"
+)
+
+_CALENDAR_HEADER_HTML = "".join(
+    f'<div style="font-weight: bold; text-align: center;">{day_name}</div>'
+    for day_name in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+)
+
+
+def _purchase_cell_html(day_num, amount_spent, signal_style):
+    """Calendar cell for a day with a recorded purchase."""
+    return (
+        f'<div style="border: 2px solid {signal_style["color"]}; border-radius: 8px; '
+        f'padding: 8px; margin: 2px; background-color: rgba(255,255,255,0.9); '
+        f'text-align: center; min-height: 80px;">'
+        f'<div style="font-weight: bold; color: #161B22; font-size: 14px;">{day_num}</div>'
+        f'<div style="font-size: 10px; color: {signal_style["color"]}; margin: 2px 0;">'
+        f"{signal_style['emoji']} {signal_style['text']}</div>"
+        f'<div style="font-size: 20px; color: #161B22; margin: 2px 0;">'
+        f"<strong>${amount_spent:.0f}</strong></div>"
+        f"</div>"
+    )
+
+
+def _planned_cell_html(day_num, future_dca_amount):
+    """Calendar cell for a future day, with the planned amount shown on hover."""
+    return (
+        f'<div style="border: 2px dashed #9CA3AF; border-radius: 8px; padding: 8px; '
+        f'margin: 2px; background-color: rgba(156,163,175,0.1); text-align: center; '
+        f'min-height: 80px;">'
+        f'<div style="font-weight: bold; color: #fff; font-size: 14px;">{day_num}</div>'
+        f'<div style="font-size: 16px; color: #6B7280; margin: 2px 0;">⏳</div>'
+        f'<div class="dca-amount" style="font-size: 16px; color: #fff; margin: 2px 0; '
+        f'position: relative; cursor: pointer;">'
+        f'<strong class="hidden-amount">${future_dca_amount:.2f}</strong>'
+        f'<span class="placeholder" style="position: absolute; left: 50%; '
+        f'transform: translateX(-50%); top: 0;">***</span>'
+        f"</div>"
+        f'<div style="font-size: 9px; color: #fff; margin: 2px 0;">Planned DCA</div>'
+        f"</div>"
+    )
+
+
+def _no_purchase_cell_html(day_num):
+    """Calendar cell for a past day without a purchase."""
+    return (
+        f'<div style="border: 1px solid #ccc; border-radius: 8px; padding: 8px; '
+        f'margin: 2px; background-color: rgba(240,240,240,0.5); text-align: center; '
+        f'min-height: 80px;">'
+        f'<div style="font-weight: bold; color: #161B22; font-size: 14px;">{day_num}</div>'
+        f'<div style="font-size: 10px; color: #F7931A; margin: 2px 0;">No Purchase</div>'
+        f"</div>"
+    )
+
+
 def render_purchasing_calendar(
     df_current, dynamic_perf, weights, current_day, total_budget
 ):
@@ -540,13 +786,13 @@ def render_purchasing_calendar(
         current_day: Current day index (0-based)
         total_budget: Total budget for the investment period
     """
-    current_data = dynamic_perf.iloc[: current_day + 1].copy()
+    current_data = dynamic_perf.iloc[: current_day + 1]  # read-only, no copy
     if current_data.empty:
         st.info("No purchasing data available for the selected time period.")
         return
 
     try:
-        features = construct_features(df_current)
+        features = get_window_features(df_current)
     except Exception as e:
         st.error(f"Error constructing features: {e}")
         return
@@ -566,248 +812,79 @@ def render_purchasing_calendar(
     future_dca_amount = remaining_budget / remaining_days if remaining_days > 0 else 0
 
     start_date = df_current.index[0]
-    end_date = start_date + pd.DateOffset(total_days - 1)
+    end_date = start_date + pd.Timedelta(days=total_days - 1)
 
     # Get current date in Pacific timezone for comparison
     today_pacific = get_today()
 
+    # Purchases by calendar date (last row wins, as with the old per-day
+    # filter), with every day's signal level classified in one pass
+    purchases = dict(
+        zip(
+            current_data["Date"].dt.date,
+            zip(
+                current_data["Amount_Spent"].to_numpy(),
+                _signal_levels(current_data["Weight"].to_numpy(), avg_weight),
+            ),
+        )
+    )
+    today_date = today_pacific.date()
+    slider_current_date = df_current.index[current_day].date()
+    end_day = end_date.date()
+
     calendar_container = st.container()
 
     with calendar_container:
+        st.markdown(_CALENDAR_STYLE, unsafe_allow_html=True)
+
         # Create a combined view: historical + future
         all_dates = pd.date_range(start=start_date, end=end_date, freq="D")
 
-        # Group by month
-        date_df = pd.DataFrame({"Date": all_dates})
-
-        date_df["YearMonth"] = pd.to_datetime(date_df["Date"]).dt.to_period("M")
-        for period in sorted(date_df["YearMonth"].unique()):
-            month_dates = date_df[date_df["YearMonth"] == period]["Date"]
-            month_start = month_dates.iloc[0]
+        # Months covered by the window, from one numpy truncation of the
+        # dates (np.unique also sorts them), rather than a filter per month
+        months = np.unique(all_dates.values.astype("datetime64[M]"))
+        for month in months:
+            first_day = pd.Timestamp(month)
+            month_label = first_day.strftime("%B %Y")
 
-            with st.expander(month_start.strftime("%B %Y")):
-                st.markdown(f"### {month_start.strftime('%B %Y')}")
-
-                month_year = period.to_timestamp()
-                first_day = month_year.replace(day=1)
+            with st.expander(month_label):
+                st.markdown(f"### {month_label}")
 
                 days_in_month = cal_module.monthrange(first_day.year, first_day.month)[
                     1
                 ]
                 first_weekday = first_day.weekday()
 
-                day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-
-                header_cols = st.columns(7)
-                for i, day_name in enumerate(day_names):
-                    with header_cols[i]:
-                        st.markdown(f"**{day_name}**")
-
-                total_cells = first_weekday + days_in_month
-                num_weeks = (total_cells + 6) // 7
-
-                for week in range(num_weeks):
-                    cols = st.columns(7)
-                    for day_of_week in range(7):
-                        cell_num = week * 7 + day_of_week
-
-                        with cols[day_of_week]:
-                            if cell_num < first_weekday:
-                                st.markdown("")
-                            elif cell_num < first_weekday + days_in_month:
-                                day_num = cell_num - first_weekday + 1
-                                current_date = first_day.replace(day=day_num)
-
-                                # Check if this date is in our historical data
-                                day_data = current_data[
-                                    current_data["Date"].dt.date == current_date.date()
-                                ]
-
-                                if not day_data.empty:
-                                    # Historical purchase
-                                    day_info = day_data.iloc[-1]
-                                    price = day_info["Price"]
-                                    amount_spent = day_info["Amount_Spent"]
-                                    weight = day_info["Weight"]
-                                    signal_style = _get_signal_style(weight, avg_weight)
-
-                                    day_style = f"""
-                                    <div style="
-                                        border: 2px solid {signal_style['color']};
-                                        border-radius: 8px;
-                                        padding: 8px;
-                                        margin: 2px;
-                                        background-color: rgba(255,255,255,0.9);
-                                        text-align: center;
-                                        min-height: 80px;
-                                    ">
-                                        <div style="font-weight: bold; color: #161B22; font-size: 14px;">
-                                            {day_num}
-                                        </div>
-                                        <div style="font-size: 10px; color: {signal_style['color']}; margin: 2px 0;">
-                                            {signal_style['emoji']} {signal_style['text']}
-                                        </div>
-                                        <div style="font-size: 20px; color: #161B22; margin: 2px 0;">
-                                            <strong>${amount_spent:.0f}</strong>
-                                        </div>
-                                    </div>
-                                    """
-                                    st.markdown(day_style, unsafe_allow_html=True)
-                                elif (
-                                    current_date.date() > today_pacific.date()
-                                    and current_date <= end_date
-                                ):
-                                    # Future planned DCA
-                                    st.markdown(
-                                        f"""
-                                    <style>
-                                        .dca-amount-{day_num} .hidden-amount {{
-                                            opacity: 0;
-                                            transition: opacity 0.2s ease;
-                                        }}
-                                        .dca-amount-{day_num} .placeholder {{
-                                            opacity: 1;
-                                            transition: opacity 0.2s ease;
-                                        }}
-                                        .dca-amount-{day_num}:hover .hidden-amount {{
-                                            opacity: 1;
-                                        }}
-                                        .dca-amount-{day_num}:hover .placeholder {{
-                                            opacity: 0;
-                                        }}
-                                    </style>
-                                    <div style="
-                                        border: 2px dashed #9CA3AF;
-                                        border-radius: 8px;
-                                        padding: 8px;
-                                        margin: 2px;
-                                        background-color: rgba(156,163,175,0.1);
-                                        text-align: center;
-                                        min-height: 80px;
-                                    ">
-                                        <div style="font-weight: bold; color: #fff; font-size: 14px;">
-                                            {day_num}
-                                        </div>
-                                        <div style="font-size: 16px; color: #6B7280; margin: 2px 0;">
-                                            ⏳
-                                        </div>
-                                        <div class="dca-amount-{day_num}" style="
-                                            font-size: 16px; 
-                                            color: #fff; 
-                                            margin: 2px 0;
-                                            position: relative;
-                                            cursor: pointer;
-                                        ">
-                                            <strong class="hidden-amount">${future_dca_amount:.2f}</strong>
-                                            <span class="placeholder" style="
-                                                position: absolute;
-                                                left: 50%;
-                                                transform: translateX(-50%);
-                                                top: 0;
-                                            ">***</span>
-                                        </div>
-                                        <div style="font-size: 9px; color: #fff; margin: 2px 0;">
-                                            Planned DCA
-                                        </div>
-                                    </div>
-                                    """,
-                                        unsafe_allow_html=True,
-                                    )
-                                else:
-                                    # Determine if this is a slider's current day to today's date (future relative to slider)
-                                    slider_current_date = df_current.index[current_day]
-
-                                    if (
-                                        current_date.date() > slider_current_date.date()
-                                        and current_date <= end_date
-                                    ):
-                                        # Future planned DCA (between slider position and end of window)
-                                        st.markdown(
-                                            f"""
-                                        <style>
-                                            .dca-amount-{day_num} .hidden-amount {{
-                                                opacity: 0;
-                                                transition: opacity 0.2s ease;
-                                            }}
-                                            .dca-amount-{day_num} .placeholder {{
-                                                opacity: 1;
-                                                transition: opacity 0.2s ease;
-                                            }}
-                                            .dca-amount-{day_num}:hover .hidden-amount {{
-                                                opacity: 1;
-                                            }}
-                                            .dca-amount-{day_num}:hover .placeholder {{
-                                                opacity: 0;
-                                            }}
-                                        </style>
-                                        <div style="
-                                            border: 2px dashed #9CA3AF;
-                                            border-radius: 8px;
-                                            padding: 8px;
-                                            margin: 2px;
-                                            background-color: rgba(156,163,175,0.1);
-                                            text-align: center;
-                                            min-height: 80px;
-                                        ">
-                                            <div style="font-weight: bold; color: #fff; font-size: 14px;">
-                                                {day_num}
-                                            </div>
-                                            <div style="font-size: 16px; color: #6B7280; margin: 2px 0;">
-                                                ⏳
-                                            </div>
-                                            <div class="dca-amount-{day_num}" style="
-                                                font-size: 16px; 
-                                                color: #fff; 
-                                                margin: 2px 0;
-                                                position: relative;
-                                                cursor: pointer;
-                                            ">
-                                                <strong class="hidden-amount">${future_dca_amount:.2f}</strong>
-                                                <span class="placeholder" style="
-                                                    position: absolute;
-                                                    left: 50%;
-                                                    transform: translateX(-50%);
-                                                    top: 0;
-                                                ">***</span>
-                                            </div>
-                                            <div style="font-size: 9px; color: #fff; margin: 2px 0;">
-                                                Planned DCA
-                                            </div>
-                                        </div>
-                                        """,
-                                            unsafe_allow_html=True,
-                                        )
-                                    elif (
-                                        current_date.date()
-                                        <= slider_current_date.date()
-                                    ):
-                                        # Past day (before slider position) with no purchase
-                                        st.markdown(
-                                            f"""
-                                        <div style="
-                                            border: 1px solid #ccc;
-                                            border-radius: 8px;
-                                            padding: 8px;
-                                            margin: 2px;
-                                            background-color: rgba(240,240,240,0.5);
-                                            text-align: center;
-                                            min-height: 80px;
-                                        ">
-                                            <div style="font-weight: bold; color: #161B22; font-size: 14px;">
-                                                {day_num}
-                                            </div>
-                                            <div style="font-size: 10px; color: #F7931A; margin: 2px 0;">
-                                                No Purchase
-                                            </div>
-                                        </div>
-                                        """,
-                                            unsafe_allow_html=True,
-                                        )
-                                    else:
-                                        st.markdown("")
-
-                            else:
-                                st.markdown("")
+                # Build the whole month as one HTML grid and send it in a
+                # single element, instead of a column and markdown per day
+                cells = [_CALENDAR_HEADER_HTML]
+                cells.extend(["<div></div>"] * first_weekday)
+
+                for day_num in range(1, days_in_month + 1):
+                    current_date = first_day.replace(day=day_num).date()
+                    purchase = purchases.get(current_date)
+
+                    if purchase is not None:
+                        # Historical purchase
+                        amount_spent, level = purchase
+                        cells.append(
+                            _purchase_cell_html(
+                                day_num, amount_spent, _SIGNAL_STYLES[level]
+                            )
+                        )
+                    elif current_date > end_day:
+                        cells.append("<div></div>")
+                    elif current_date > today_date or current_date > slider_current_date:
+                        # Future planned DCA (after today, or after the slider position)
+                        cells.append(_planned_cell_html(day_num, future_dca_amount))
+                    else:
+                        # Past day (before slider position) with no purchase
+                        cells.append(_no_purchase_cell_html(day_num))
+
+                st.markdown(
+                    '<div class="cal-grid">' + "".join(cells) + "</div>",
+                    unsafe_allow_html=True,
+                )
 
         st.markdown("#### Legend")
         legend_cols = st.columns(6)
@@ -842,8 +919,6 @@ def render_accumulation_advantage(dynamic_perf, uniform_perf, df_window):
     """
     Render Accumulation Advantage visualization showing cumulative sats advantage
     """
-    import plotly.graph_objects as go
-
     analyzer = AccumulationAnalyzer(dynamic_perf, uniform_perf, df_window)
 
     # Get advantage data
@@ -972,9 +1047,6 @@ def render_smart_timing_heatmap(dynamic_perf, uniform_perf, df_window):
     """
     Render Smart Timing Heatmap showing purchase efficiency by day
     """
-    import plotly.graph_objects as go
-    import calendar
-
     analyzer = AccumulationAnalyzer(dynamic_perf, uniform_perf, df_window)
     heatmap_data = analyzer.daily_efficiency_heatmap_data()
 
@@ -985,22 +1057,30 @@ def render_smart_timing_heatmap(dynamic_perf, uniform_perf, df_window):
     st.markdown("### 🎯 Smart Timing Heatmap")
     st.info("Darker green = bought at better prices. This shows how well the algorithm times the market.")
 
-    # Group by month for monthly heatmaps
-    heatmap_data['YearMonth'] = pd.to_datetime(heatmap_data['Date']).dt.to_period('M')
-
-    for period in sorted(heatmap_data['YearMonth'].unique()):
-        month_data = heatmap_data[heatmap_data['YearMonth'] == period].copy()
-
-        if month_data.empty:
-            continue
-
-        month_start = pd.to_datetime(month_data['Date'].iloc[0])
+    # Group by month for monthly heatmaps, using int64 month keys
+    # (datetime64[M]) instead of comparing Period objects
+    dates = pd.to_datetime(heatmap_data['Date']).to_numpy().astype('datetime64[D]')
+    months = dates.astype('datetime64[M]')
+    month_keys = months.view('int64')
+    day_nums = (dates - months.astype('datetime64[D]')).astype('int64') + 1
+    efficiencies = heatmap_data['Efficiency'].to_numpy()
+    prices = heatmap_data['Price'].to_numpy()
+    amounts = heatmap_data['Amount_Spent'].to_numpy()
+
+    for key in np.unique(month_keys):
+        rows = np.flatnonzero(month_keys == key)
+        month_start = pd.Timestamp(np.datetime64(key, 'M'))
+
+        # Row for each day of the month (first match wins, as before)
+        day_rows = {}
+        for row in rows[::-1]:
+            day_rows[day_nums[row]] = row
 
         with st.expander(f"📅 {month_start.strftime('%B %Y')}", expanded=True):
             # Create calendar matrix
             year = month_start.year
             month = month_start.month
-            cal = calendar.monthcalendar(year, month)
+            cal = cal_module.monthcalendar(year, month)
 
             # Create efficiency matrix
             efficiency_matrix = []
@@ -1014,13 +1094,12 @@ def render_smart_timing_heatmap(dynamic_perf, uniform_perf, df_window):
                         week_efficiency.append(None)
                         week_text.append("")
                     else:
-                        day_date = pd.Timestamp(year=year, month=month, day=day)
-                        day_row = month_data[pd.to_datetime(month_data['Date']).dt.date == day_date.date()]
+                        row = day_rows.get(day)
 
-                        if not day_row.empty:
-                            efficiency = day_row['Efficiency'].iloc[0]
-                            price = day_row['Price'].iloc[0]
-                            amount = day_row['Amount_Spent'].iloc[0]
+                        if row is not None:
+                            efficiency = efficiencies[row]
+                            price = prices[row]
+                            amount = amounts[row]
                             week_efficiency.append(efficiency)
                             week_text.append(
                                 f"Day {day}<br>Efficiency: {efficiency:.1f}/100<br>"
@@ -1163,17 +1242,14 @@ def render_efficiency_metrics_cards(dynamic_perf, uniform_perf, df_window):
     top_purchases = analyzer.top_purchases(n=5)
 
     if not top_purchases.empty:
-        top_purchases_display = top_purchases.copy()
-        top_purchases_display['Date'] = pd.to_datetime(top_purchases_display['Date']).dt.strftime('%Y-%m-%d')
-        top_purchases_display['Price'] = top_purchases_display['Price'].apply(lambda x: f"${x:,.0f}")
-        top_purchases_display['BTC_Bought'] = top_purchases_display['BTC_Bought'].apply(lambda x: f"{x:.8f} ₿")
-        top_purchases_display['Amount_Spent'] = top_purchases_display['Amount_Spent'].apply(lambda x: f"${x:.0f}")
-        top_purchases_display['Efficiency'] = top_purchases_display['Efficiency'].apply(lambda x: f"{x:.1f}/100")
-
-        top_purchases_display = top_purchases_display.rename(columns={
-            'BTC_Bought': 'BTC Bought',
-            'Amount_Spent': 'Amount Spent',
-            'Efficiency': 'Efficiency Score'
+        # Build the string-formatted display frame directly, rather than
+        # copying the numeric frame and overwriting every column
+        top_purchases_display = pd.DataFrame({
+            'Date': pd.to_datetime(top_purchases['Date']).dt.strftime('%Y-%m-%d'),
+            'Price': top_purchases['Price'].map("${:,.0f}".format),
+            'BTC Bought': top_purchases['BTC_Bought'].map("{:.8f} ₿".format),
+            'Amount Spent': top_purchases['Amount_Spent'].map("${:.0f}".format),
+            'Efficiency Score': top_purchases['Efficiency'].map("{:.1f}/100".format),
         })
 
         st.dataframe(top_purchases_display, hide_index=True, width="stretch")
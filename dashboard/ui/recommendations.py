@@ -1,7 +1,8 @@
 # dashboard/ui/recommendations.py
 import streamlit as st
 import pandas as pd
-from dashboard.model.strategy_new import construct_features, get_buy_signal_strength
+from dashboard.model.strategy_new import get_buy_signal_strength
+from dashboard.ui.charts import get_window_features
 
 
 def render_recommendations(dynamic_perf, df_current, weights, budget, current_day):
@@ -28,8 +29,9 @@ def render_recommendations(dynamic_perf, df_current, weights, budget, current_da
 
     with st.expander("Analysis and Details"):
         # --- Signal Analysis ---
-        features = construct_features(sim_slice)
-        today_features = features.iloc[-1]
+        # Same row as construct_features(sim_slice).iloc[-1], from the shared cache
+        features = get_window_features(df_current)
+        today_features = features.iloc[current_day]
         today_ma200 = today_features["ma200"]
         today_std200 = today_features["std200"]
 
@@ -3,7 +3,7 @@ import streamlit as st
 # from dashboard.backend.gsheet_utils import update_user_preferences
 from dashboard.backend.supabase_utils import (
     update_user_preferences,
-    get_user_info_by_email,
+    get_cached_user_info,
 )
 
 import time
@@ -17,7 +17,7 @@ def modal(email: str):
             "Update info",
         ):
             st.markdown("Save your investment info")
-            user_info = get_user_info_by_email(email)
+            user_info = get_cached_user_info(email)
             budget = st.number_input(
                 "What's your budget?", value=int(float(user_info["budget"])), step=100
             )
@@ -49,6 +49,9 @@ def modal(email: str):
                     "boost_factor": 1.25,
                 }
                 update_user_preferences(saved_preferences)
+                get_cached_user_info.clear()
+                # Make the sidebar refetch the saved values on the next run
+                st.session_state.pop("_user_info_email", None)
                 st.toast("Your investment preferences have been saved!")
                 time.sleep(1)
                 st.rerun()
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from dashboard.ui import charts
+
+
+def _price_frames(days=400, window=120):
+    index = pd.date_range("2024-01-01", periods=days, freq="D")
+    prices = 40_000.0 + 5_000.0 * np.sin(np.arange(days) / 20.0)
+    df_chart = pd.DataFrame({"PriceUSD": prices, "Type": "Historical"}, index=index)
+    df_window = df_chart.iloc[-window:]
+    weights = pd.Series(1.0 / window, index=df_window.index)
+    return df_chart, df_window, weights
+
+
+def test_price_signals_chart_keeps_reference_lines(monkeypatch):
+    captured = {}
+    monkeypatch.setattr(
+        charts.st, "plotly_chart", lambda fig, **kwargs: captured.setdefault("fig", fig)
+    )
+    df_chart, df_window, weights = _price_frames()
+
+    charts.render_price_signals_chart(
+        df_chart_display=df_chart,
+        weights=weights,
+        df_window=df_window,
+        current_day=60,
+    )
+
+    fig = captured["fig"]
+    # Today and Accumulation Start vlines, plus the Uniform DCA hline
+    assert len(fig.layout.shapes) == 3
+    assert "Uniform DCA" in [a.text for a in fig.layout.annotations]
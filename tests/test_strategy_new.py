@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from dashboard.model.strategy_new import get_market_regime
+
+
+def _price_frame(daily_return, days=40):
+    index = pd.date_range("2024-01-01", periods=days, freq="D")
+    prices = 30_000.0 * (1.0 + daily_return) ** np.arange(days)
+    return pd.DataFrame({"PriceUSD": prices}, index=index)
+
+
+def test_market_regime_rising():
+    assert get_market_regime(_price_frame(0.02)) == "Bull Market (Low Vol)"
+
+
+def test_market_regime_flat():
+    assert get_market_regime(_price_frame(0.0)) == "Sideways/Consolidation"
+
+
+def test_market_regime_falling():
+    assert get_market_regime(_price_frame(-0.02)) == "Bear Market (Low Vol)"